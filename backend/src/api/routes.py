@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import Response
+import asyncio
 import logging
 from typing import List
 import json
@@ -17,6 +18,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Header carrying the handler's extra payload (substitution options or timer data) per state
+EXTRA_DATA_HEADERS = {
+    ConversationState.ASKING_SUBSTITUTION: "X-Substitution-Options",
+    ConversationState.COOKING: "X-Timer-Data",
+}
+
 def init_router(
     recipe_service: RecipeService,
     tts_service: TTSService,
@@ -102,7 +109,7 @@ def init_router(
             raise HTTPException(status_code=404, detail="Recipe not found")
         
         try:
-            audio_bytes = tts_service.generate_recipe_summary(recipe.__dict__)
+            audio_bytes = await tts_service.generate_recipe_summary_async(recipe.__dict__)
             return Response(content=audio_bytes, media_type="audio/mpeg")
         except Exception as e:
             logger.exception("Error generating audio summary")
@@ -121,7 +128,9 @@ def init_router(
             raise HTTPException(status_code=404, detail="Recipe not found")
         
         try:
-            substitution_data = substitution_service.get_substitution_suggestions(
+            # Mistral call; run it off the event loop
+            substitution_data = await asyncio.to_thread(
+                substitution_service.get_substitution_suggestions,
                 request.ingredient,
                 recipe.__dict__
             )
@@ -176,21 +185,21 @@ def init_router(
                 response_data, next_state = None, voice_input.current_state
                 
                 if voice_input.current_state == ConversationState.INITIAL_SUMMARY:
-                    audio_data, response_text = tts_service.generate_recipe_summary(recipe.__dict__, voice_input.current_state)
+                    audio_data, response_text = await tts_service.generate_recipe_summary_async(recipe.__dict__, voice_input.current_state)
                     next_state = ConversationState.ASKING_SERVINGS
                 else:
                     if voice_input.current_state == ConversationState.ASKING_SERVINGS:
-                        audio_data, response_text = tts_service.generate_voice_response(
+                        audio_data, response_text = await tts_service.generate_voice_response_async(
                             "How many servings would you like to make?",
                             voice_input.current_state
                         )
                     elif voice_input.current_state == ConversationState.ASKING_SUBSTITUTION:
-                        audio_data, response_text = tts_service.generate_voice_response(
+                        audio_data, response_text = await tts_service.generate_voice_response_async(
                             "Do you need to substitute any ingredients? If yes, please tell me which ingredient.",
                             voice_input.current_state
                         )
                     elif voice_input.current_state == ConversationState.READY_TO_COOK:
-                        audio_data, response_text = tts_service.generate_recipe_summary(recipe.__dict__, voice_input.current_state)
+                        audio_data, response_text = await tts_service.generate_recipe_summary_async(recipe.__dict__, voice_input.current_state)
                 
                 # Create a summary for headers
                 header_summary = create_header_summary(response_text)
@@ -210,101 +219,36 @@ def init_router(
                 )
 
             # Handle normal voice interaction based on current state
-            if voice_input.current_state in [ConversationState.INITIAL_SUMMARY, ConversationState.ASKING_SERVINGS]:
-                audio_data, response_text, next_state, updated_recipe = voice_interaction_service.process_servings_request(
-                    voice_input.transcript,
-                    recipe.__dict__
-                )
-                
-                if updated_recipe:
-                    updated_recipe = recipe_service.create_recipe(**updated_recipe)
-                    recipe_id = updated_recipe.id
-                
-                # Create a summary for headers
-                header_summary = create_header_summary(response_text)
-                
-                headers = {
-                    "X-Next-State": next_state,
-                    "X-Updated-Recipe-Id": recipe_id if updated_recipe else None,
-                    "X-Response-Text": make_header_safe(header_summary),
-                    "X-Full-Response": make_header_safe(response_text),
-                    "X-Response-Text-Encoded": "true",
-                    "Access-Control-Expose-Headers": "X-Next-State, X-Updated-Recipe-Id, X-Response-Text, X-Full-Response, X-Response-Text-Encoded"
-                }
-
-            elif voice_input.current_state == ConversationState.ASKING_SUBSTITUTION:
-                audio_data, response_text, next_state, updated_recipe, substitutions = voice_interaction_service.process_substitution_request(
-                    voice_input.transcript,
-                    recipe.__dict__
-                )
-                
-                if updated_recipe:
-                    updated_recipe = recipe_service.create_recipe(**updated_recipe)
-                    recipe_id = updated_recipe.id
-                
-                # Create a summary for headers
-                header_summary = create_header_summary(response_text)
-                
-                headers = {
-                    "X-Next-State": next_state,
-                    "X-Updated-Recipe-Id": recipe_id if updated_recipe else None,
-                    "X-Response-Text": make_header_safe(header_summary),
-                    "X-Full-Response": make_header_safe(response_text),
-                    "X-Response-Text-Encoded": "true",
-                    "Access-Control-Expose-Headers": "X-Next-State, X-Updated-Recipe-Id, X-Response-Text, X-Full-Response, X-Response-Text-Encoded, X-Substitution-Options"
-                }
-                
-                if substitutions:
-                    # Ensure substitutions JSON is header-safe
-                    substitutions_json = json.dumps(substitutions)
-                    headers["X-Substitution-Options"] = make_header_safe(substitutions_json)
-
-            elif voice_input.current_state == ConversationState.READY_TO_COOK:
-                audio_data, response_text, next_state, updated_recipe = voice_interaction_service.process_ready_to_cook(
-                    voice_input.transcript,
-                    recipe.__dict__
-                )
-                
-                if updated_recipe:
-                    updated_recipe = recipe_service.create_recipe(**updated_recipe)
-                    recipe_id = updated_recipe.id
-                
-                # Create a summary for headers
-                header_summary = create_header_summary(response_text)
-                
-                headers = {
-                    "X-Next-State": next_state,
-                    "X-Updated-Recipe-Id": recipe_id if updated_recipe else None,
-                    "X-Response-Text": make_header_safe(header_summary),
-                    "X-Full-Response": make_header_safe(response_text),
-                    "X-Response-Text-Encoded": "true",
-                    "Access-Control-Expose-Headers": "X-Next-State, X-Updated-Recipe-Id, X-Response-Text, X-Full-Response, X-Response-Text-Encoded"
-                }
-
-            elif voice_input.current_state == ConversationState.COOKING:
-                audio_data, response_text, next_state, updated_recipe, timer_data = voice_interaction_service.process_cooking_step(
-                    voice_input.transcript,
-                    recipe.__dict__
-                )
-                
-                if updated_recipe:
-                    updated_recipe = recipe_service.create_recipe(**updated_recipe)
-                    recipe_id = updated_recipe.id
-                
-                # Create a summary for headers
-                header_summary = create_header_summary(response_text)
-                
-                headers = {
-                    "X-Next-State": next_state,
-                    "X-Updated-Recipe-Id": recipe_id if updated_recipe else None,
-                    "X-Response-Text": make_header_safe(header_summary),
-                    "X-Full-Response": make_header_safe(response_text),
-                    "X-Response-Text-Encoded": "true",
-                    "Access-Control-Expose-Headers": "X-Next-State, X-Updated-Recipe-Id, X-Response-Text, X-Full-Response, X-Response-Text-Encoded, X-Timer-Data"
-                }
-                
-                if timer_data:
-                    headers["X-Timer-Data"] = make_header_safe(json.dumps(timer_data))
+            # The service reads, updates and saves the recipe as one turn
+            audio_data, response_text, next_state, updated_recipe, extra_data = await voice_interaction_service.process_voice_input(
+                voice_input.current_state,
+                voice_input.transcript,
+                recipe_id
+            )
+            
+            if updated_recipe:
+                recipe_id = updated_recipe.id
+            
+            # Create a summary for headers
+            header_summary = create_header_summary(response_text)
+            
+            exposed_headers = "X-Next-State, X-Updated-Recipe-Id, X-Response-Text, X-Full-Response, X-Response-Text-Encoded"
+            extra_header = EXTRA_DATA_HEADERS.get(voice_input.current_state)
+            if extra_header:
+                exposed_headers += f", {extra_header}"
+            
+            headers = {
+                "X-Next-State": next_state,
+                "X-Updated-Recipe-Id": recipe_id if updated_recipe else None,
+                "X-Response-Text": make_header_safe(header_summary),
+                "X-Full-Response": make_header_safe(response_text),
+                "X-Response-Text-Encoded": "true",
+                "Access-Control-Expose-Headers": exposed_headers
+            }
+            
+            if extra_header and extra_data:
+                # Ensure the substitution options / timer data JSON is header-safe
+                headers[extra_header] = make_header_safe(json.dumps(extra_data))
 
             return Response(
                 content=audio_data,
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import os
@@ -37,10 +38,18 @@ voice_interaction_service = VoiceInteractionService(
     tts_service=tts_service,
     recipe_service=recipe_service,
     substitution_service=substitution_service,
-    parallel_task_service=parallel_task_service
+    parallel_task_service=parallel_task_service,
+    # Pre-synthesize the next step's audio; costs ElevenLabs characters for steps that may never be read
+    prefetch_tts=os.getenv("TTS_PREFETCH", "").lower() in ("1", "true", "yes")
 )
 
-app = FastAPI(title="CookAway API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop the background TTS prefetch worker
+    voice_interaction_service.shutdown()
+
+app = FastAPI(title="CookAway API", version="1.0.0", lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
@@ -1,11 +1,16 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 import logging
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
 import time
 
 logger = logging.getLogger(__name__)
 
+# Instruction words that mark prep work, which is suggested first while a timer runs;
+# matched anywhere in the instruction, so "chopped" and "cutting" count too
+PREP_RE = re.compile("chop|dice|slice|mince|prepare|cut", re.IGNORECASE)
+
 class TaskStatus(Enum):
     NOT_STARTED = "not_started"
     IN_PROGRESS = "in_progress"
@@ -20,23 +25,29 @@ class ParallelTask:
     prerequisites: List[int]  # step numbers that must be completed before this can start
     dependencies: List[int]  # step numbers that depend on this task
     status: TaskStatus = TaskStatus.NOT_STARTED
+    prep_priority: int = field(init=False)  # 0 for prep work, 1 otherwise
+
+    def __post_init__(self):
+        self.prep_priority = 0 if PREP_RE.search(self.instruction) else 1
 
 class ParallelTaskService:
     def __init__(self):
-        self.parallel_tasks = {}
-        self.active_timer_step = None
-        self.timer_start_time = None
-        self._completed_steps = []
-        self.recipe_steps = []
-        self.current_timer_step = None  # Track which step has the active timer
+        self.parallel_tasks: Dict[int, ParallelTask] = {}
+        self.active_timer_step: Optional[int] = None
+        self.timer_start_time: Optional[float] = None
+        self._completed_steps: List[int] = []
+        self._completed_set: Set[int] = set()  # mirrors _completed_steps for membership tests
+        self.recipe_steps: List[Dict] = []
+        self.current_timer_step: Optional[int] = None  # Track which step has the active timer
         logger.info("ParallelTaskService initialized")
 
-    def analyze_recipe_for_parallel_tasks(self, recipe_steps):
+    def analyze_recipe_for_parallel_tasks(self, recipe_steps: List[Dict]) -> None:
         """Analyze recipe steps to identify parallel tasks and their relationships."""
         logger.info("Starting recipe analysis for parallel tasks")
-        logger.info(f"Recipe steps to analyze: {recipe_steps}")
+        logger.info("Recipe steps to analyze: %s", recipe_steps)
         self.parallel_tasks.clear()
         self._completed_steps.clear()
+        self._completed_set.clear()
         self.recipe_steps = recipe_steps
         
         # First pass: identify parallel tasks and their basic relationships
@@ -87,7 +98,7 @@ class ParallelTaskService:
             # Check if this is a parallel task or uses prepared ingredients
             if (any(keyword in instruction for keyword in ['while', 'during', 'meanwhile']) or
                 any(word in instruction for word in ['chopped', 'diced', 'sliced'])):
-                logger.info(f"Found potential parallel task in step {step_number}")
+                logger.info("Found potential parallel task in step %s", step_number)
                 prerequisites = []
                 dependencies = []
                 
@@ -113,7 +124,7 @@ class ParallelTaskService:
                     status=TaskStatus.NOT_STARTED
                 )
         
-        logger.info(f"Initial parallel tasks identified: {self.parallel_tasks}")
+        logger.info("Initial parallel tasks identified: %s", self.parallel_tasks)
         
         # Second pass: analyze dependencies
         for step in recipe_steps:
@@ -165,23 +176,23 @@ class ParallelTaskService:
                     step['next_possible_steps'].remove(2)
                     step['next_possible_steps'].insert(0, 2)
 
-    def _is_task_available(self, task, current_step, remaining_time):
+    def _is_task_available(self, task: ParallelTask, current_step: int, remaining_time: float) -> bool:
         """Check if a parallel task is available during the current timer period."""
-        logger.info(f"Checking if task {task.step_number} is available during step {current_step}")
+        logger.info("Checking if task %s is available during step %s", task.step_number, current_step)
         
         # Task must not be completed or in progress
         if task.status in [TaskStatus.COMPLETED, TaskStatus.IN_PROGRESS]:
-            logger.info(f"Task {task.step_number} is not available: status is {task.status}")
+            logger.info("Task %s is not available: status is %s", task.step_number, task.status)
             return False
             
         # For steps with timers, ensure they can be completed in remaining time
         if task.estimated_time > remaining_time:
-            logger.info(f"Task {task.step_number} is not available: takes too long ({task.estimated_time}s) for remaining time ({remaining_time}s)")
+            logger.info("Task %s is not available: takes too long (%ss) for remaining time (%ss)", task.step_number, task.estimated_time, remaining_time)
             return False
             
         # Special case: During water boiling (step 1), always allow step 2 if not completed or in progress
         if current_step == 1 and task.step_number == 2 and task.status == TaskStatus.NOT_STARTED:
-            logger.info(f"Task 2 is available during water boiling (step 1)")
+            logger.info("Task 2 is available during water boiling (step 1)")
             return True
             
         # Special case: During pasta cooking (step 3)
@@ -193,28 +204,29 @@ class ParallelTaskService:
                 
             # For step 5 (adding garlic), check if both prerequisites are met
             if task.step_number == 5:
-                if 2 not in self._completed_steps:
+                if 2 not in self._completed_set:
                     logger.info("Step 5 is not available: step 2 (chopping) not completed")
                     return False
-                if 4 not in self._completed_steps:
+                if 4 not in self._completed_set:
                     logger.info("Step 5 is not available: step 4 (heating oil) not completed")
                     return False
                 logger.info("Step 5 is available: all prerequisites completed")
                 return True
         
         # For other steps, check prerequisites
-        if not all(prereq in self._completed_steps for prereq in task.prerequisites):
-            logger.info(f"Task {task.step_number} is not available: prerequisites {task.prerequisites} not all completed (completed steps: {self._completed_steps})")
+        if not all(prereq in self._completed_set for prereq in task.prerequisites):
+            logger.info("Task %s is not available: prerequisites %s not all completed (completed steps: %s)", task.step_number, task.prerequisites, self._completed_steps)
             return False
         
-        logger.info(f"Task {task.step_number} is available")
+        logger.info("Task %s is available", task.step_number)
         return True
 
-    def get_available_parallel_tasks(self, current_step, remaining_time):
+    def get_available_parallel_tasks(self, current_step: int, remaining_time: float) -> List[Dict]:
         """Get list of tasks that can be performed during the current timer period."""
         available_tasks = []
-        logger.info(f"Getting available tasks for step {current_step} with {remaining_time}s remaining")
-        logger.info(f"Current parallel tasks: {[f'Step {num}: {task.instruction}' for num, task in self.parallel_tasks.items()]}")
+        logger.info("Getting available tasks for step %s with %ss remaining", current_step, remaining_time)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Current parallel tasks: %s", [f'Step {num}: {task.instruction}' for num, task in self.parallel_tasks.items()])
         
         # Special case: During water boiling (step 1), always include step 2
         if current_step == 1:
@@ -226,37 +238,44 @@ class ParallelTaskService:
                     'instruction': step2.instruction,
                     'estimated_time': step2.estimated_time
                 }
-                logger.info(f"Adding task data for step 2: {task_data}")
+                logger.info("Adding task data for step 2: %s", task_data)
                 available_tasks.append(task_data)
         
         # Check other tasks
         for task in self.parallel_tasks.values():
             if task.step_number != 2:  # Skip step 2 as it's handled above
-                logger.info(f"Checking availability of step {task.step_number}")
-                logger.info(f"Task details: status={task.status}, prerequisites={task.prerequisites}, estimated_time={task.estimated_time}")
+                logger.info("Checking availability of step %s", task.step_number)
+                logger.info("Task details: status=%s, prerequisites=%s, estimated_time=%s", task.status, task.prerequisites, task.estimated_time)
                 
                 if self._is_task_available(task, current_step, remaining_time):
-                    logger.info(f"Task {task.step_number} is available")
+                    logger.info("Task %s is available", task.step_number)
                     task_data = {
                         'step_number': task.step_number,
                         'instruction': task.instruction,
                         'estimated_time': task.estimated_time
                     }
-                    logger.info(f"Adding task data: {task_data}")
+                    logger.info("Adding task data: %s", task_data)
                     available_tasks.append(task_data)
                 else:
-                    logger.info(f"Task {task.step_number} is not available")
+                    logger.info("Task %s is not available", task.step_number)
         
-        logger.info(f"Final available tasks: {available_tasks}")
+        logger.info("Final available tasks: %s", available_tasks)
         return available_tasks
 
-    def start_timer_period(self, step_number):
+    def rank_tasks(self, tasks: List[Dict]) -> List[Dict]:
+        """Order available tasks with prep work first, then by estimated time."""
+        return sorted(
+            tasks,
+            key=lambda task: (self.parallel_tasks[task['step_number']].prep_priority, task['estimated_time'])
+        )
+
+    def start_timer_period(self, step_number: int) -> None:
         """Start a timer period for a step."""
-        logger.info(f"Starting timer period for step {step_number}")
+        logger.info("Starting timer period for step %s", step_number)
         
         # If there's already an active timer, log a warning
         if self.current_timer_step is not None:
-            logger.warning(f"Starting new timer for step {step_number} while step {self.current_timer_step} timer is still active")
+            logger.warning("Starting new timer for step %s while step %s timer is still active", step_number, self.current_timer_step)
             
         self.active_timer_step = step_number
         self.timer_start_time = time.time()
@@ -269,54 +288,54 @@ class ParallelTaskService:
         
         # Log available tasks at timer start without marking them as completed
         available = self.get_available_parallel_tasks(step_number, float('inf'))
-        logger.info(f"Available tasks at timer start: {available}")
+        logger.info("Available tasks at timer start: %s", available)
         
         # Mark only the timer step as in progress
         if step_number in self.parallel_tasks:
             self.parallel_tasks[step_number].status = TaskStatus.IN_PROGRESS
-            logger.info(f"Marked step {step_number} as in progress")
+            logger.info("Marked step %s as in progress", step_number)
 
-    def end_timer_period(self):
+    def end_timer_period(self) -> Dict:
         """End the current timer period and determine next steps."""
         logger.info("Ending timer period")
         
         # Mark the timer step as completed
         if self.current_timer_step:
-            logger.info(f"Marking timer step {self.current_timer_step} as completed")
+            logger.info("Marking timer step %s as completed", self.current_timer_step)
             self.complete_task(self.current_timer_step)
         
         # First, look for steps that can be executed immediately (no timer dependencies)
         next_main_step = None
         for step in self.recipe_steps:
             step_num = step['step']
-            if step_num not in self._completed_steps:
+            if step_num not in self._completed_set:
                 # Check if this step has any uncompleted prerequisites
                 has_uncompleted_prereq = False
                 if step_num in self.parallel_tasks:
                     for prereq in self.parallel_tasks[step_num].prerequisites:
-                        if prereq not in self._completed_steps:
+                        if prereq not in self._completed_set:
                             has_uncompleted_prereq = True
                             break
                 
                 if not has_uncompleted_prereq:
                     next_main_step = step_num
-                    logger.info(f"Found next executable step with no dependencies: {next_main_step}")
+                    logger.info("Found next executable step with no dependencies: %s", next_main_step)
                     break
         
         # If no immediately executable steps found, look for steps with timer dependencies
         if next_main_step is None:
             for step in self.recipe_steps:
                 step_num = step['step']
-                if step_num not in self._completed_steps:
+                if step_num not in self._completed_set:
                     next_main_step = step_num
-                    logger.info(f"No immediately executable steps found, using step with timer dependency: {next_main_step}")
+                    logger.info("No immediately executable steps found, using step with timer dependency: %s", next_main_step)
                     break
         
         # Get available tasks for the next step
         available_next_steps = []
         if next_main_step:
             available_next_steps = self.get_available_parallel_tasks(next_main_step, float('inf'))
-            logger.info(f"Next main step: {next_main_step}, Available tasks: {available_next_steps}")
+            logger.info("Next main step: %s, Available tasks: %s", next_main_step, available_next_steps)
         
         result = {
             'completed_parallel_tasks': [
@@ -332,30 +351,31 @@ class ParallelTaskService:
         self.timer_start_time = None
         self.current_timer_step = None
         
-        logger.info(f"Timer period ended. Result: {result}")
+        logger.info("Timer period ended. Result: %s", result)
         return result
 
-    def complete_task(self, step_number):
+    def complete_task(self, step_number: int) -> None:
         """Mark a task as completed and check for next available steps."""
-        logger.info(f"Marking step {step_number} as completed")
+        logger.info("Marking step %s as completed", step_number)
         
         if step_number in self.parallel_tasks:
             self.parallel_tasks[step_number].status = TaskStatus.COMPLETED
-            logger.info(f"Updated parallel task {step_number} status to COMPLETED")
+            logger.info("Updated parallel task %s status to COMPLETED", step_number)
             
-        if step_number not in self._completed_steps:
+        if step_number not in self._completed_set:
             self._completed_steps.append(step_number)
-            logger.info(f"Added step {step_number} to completed steps. Current completed steps: {self._completed_steps}")
+            self._completed_set.add(step_number)
+            logger.info("Added step %s to completed steps. Current completed steps: %s", step_number, self._completed_steps)
         
         # If this was a timer step, clear the timer state
         if step_number == self.current_timer_step:
-            logger.info(f"Completed timer step {step_number}, clearing timer state")
+            logger.info("Completed timer step %s, clearing timer state", step_number)
             self.current_timer_step = None
             self.active_timer_step = None
             self.timer_start_time = None
 
     @property
-    def completed_steps(self):
+    def completed_steps(self) -> List[int]:
         """Get list of completed step numbers."""
         return self._completed_steps
 
@@ -370,7 +390,7 @@ class ParallelTaskService:
         elif any(word in step['instruction'].lower() for word in ["carefully", "precisely"]):
             base_time = 180
         
-        logger.debug(f"Estimated time for step: {base_time}s")
+        logger.debug("Estimated time for step: %ss", base_time)
         return base_time
 
     def _find_prerequisites(self, step: Dict, all_steps: List[Dict]) -> List[int]:
@@ -393,7 +413,7 @@ class ParallelTaskService:
             if self._step_depends_on(step, prev_step):
                 prerequisites.add(i)
         
-        logger.debug(f"Found prerequisites for step: {list(prerequisites)}")
+        logger.debug("Found prerequisites for step: %s", list(prerequisites))
         return list(prerequisites)
 
     def _find_dependencies(self, step: Dict, all_steps: List[Dict]) -> List[int]:
@@ -406,7 +426,7 @@ class ParallelTaskService:
                 dependencies.append(i)
         
         if dependencies:
-            logger.debug(f"Found dependencies for step: {dependencies}")
+            logger.debug("Found dependencies for step: %s", dependencies)
         return dependencies
 
     def _step_depends_on(self, step: Dict, other_step: Dict) -> bool:
@@ -431,7 +451,7 @@ class ParallelTaskService:
                 # Check if this step needs a modified state and if the other step creates that state
                 for action, state in zip(state_changes, modified_states):
                     if action in other_text and state in step_text:
-                        logger.debug(f"Found ingredient state dependency: '{step_text}' needs {ingredient} from '{other_text}'")
+                        logger.debug("Found ingredient state dependency: '%s' needs %s from '%s'", step_text, ingredient, other_text)
                         return True
         
         return False
@@ -465,20 +485,20 @@ class ParallelTaskService:
                 important_terms.append(phrase_lower)
         
         if important_terms:
-            logger.debug(f"Extracted key terms: {important_terms}")
+            logger.debug("Extracted key terms: %s", important_terms)
         return list(set(important_terms))  # Remove duplicates
 
     def _get_next_available_steps(self) -> List[int]:
         """Get steps that can be done next based on completions."""
         available = []
         for step_num in range(1, max(self.parallel_tasks.keys()) + 1):
-            if step_num not in self._completed_steps:
+            if step_num not in self._completed_set:
                 task = self.parallel_tasks.get(step_num)
-                if task and all(prereq in self._completed_steps for prereq in task.prerequisites):
+                if task and all(prereq in self._completed_set for prereq in task.prerequisites):
                     available.append(step_num)
         
         if available:
-            logger.debug(f"Next available steps: {available}")
+            logger.debug("Next available steps: %s", available)
         return available
 
     def _has_dependencies(self, step: Dict, other_step: Dict) -> bool:
@@ -490,29 +510,39 @@ class ParallelTaskService:
         # Check for any term overlap that might indicate a dependency
         return bool(set(step_terms) & set(other_terms))
 
-    def mark_step_completed(self, step_number):
+    def mark_step_completed(self, step_number: int) -> List[Dict]:
         """Mark a task as completed and check for next available steps."""
-        logger.info(f"Marking step {step_number} as completed")
-        
-        if step_number in self.parallel_tasks:
-            self.parallel_tasks[step_number].status = TaskStatus.COMPLETED
-            logger.info(f"Updated parallel task {step_number} status to COMPLETED")
+        return self.mark_steps_completed((step_number,))
+
+    def mark_steps_completed(self, step_numbers: Iterable[int]) -> List[Dict]:
+        """Mark several tasks as completed, then check for next available steps once."""
+        step_number = None
+        for step_number in step_numbers:
+            logger.info("Marking step %s as completed", step_number)
             
-        if step_number not in self._completed_steps:
-            self._completed_steps.append(step_number)
-            logger.info(f"Added step {step_number} to completed steps. Current completed steps: {self._completed_steps}")
+            if step_number in self.parallel_tasks:
+                self.parallel_tasks[step_number].status = TaskStatus.COMPLETED
+                logger.info("Updated parallel task %s status to COMPLETED", step_number)
+                
+            if step_number not in self._completed_set:
+                self._completed_steps.append(step_number)
+                self._completed_set.add(step_number)
+                logger.info("Added step %s to completed steps. Current completed steps: %s", step_number, self._completed_steps)
+            
+            # If this was a timer step, clear the timer state
+            if step_number == self.current_timer_step:
+                logger.info("Completed timer step %s, clearing timer state", step_number)
+                self.current_timer_step = None
+                self.active_timer_step = None
+                self.timer_start_time = None
         
-        # If this was a timer step, clear the timer state
-        if step_number == self.current_timer_step:
-            logger.info(f"Completed timer step {step_number}, clearing timer state")
-            self.current_timer_step = None
-            self.active_timer_step = None
-            self.timer_start_time = None
+        if step_number is None:
+            return []
         
         # Check for any steps that can now be started
         available_tasks = self.get_available_parallel_tasks(
             self.current_timer_step if self.current_timer_step else step_number,
             float('inf')
         )
-        logger.info(f"Available tasks after completing step {step_number}: {available_tasks}")
+        logger.info("Available tasks after completing step %s: %s", step_number, available_tasks)
         return available_tasks 
\ No newline at end of file
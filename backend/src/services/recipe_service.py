@@ -59,6 +59,11 @@ class RecipeSchema(BaseModel):
     steps: List[RecipeStep]
     equipment: List[str] = Field(description="Required kitchen equipment")
 
+def _normalize_steps(steps: list) -> None:
+    """Give every step a dependencies list, so step validation can read it directly."""
+    for step in steps:
+        step["dependencies"] = list(step.get("dependencies") or ())
+
 class Recipe:
     def __init__(self, title: str, metadata: dict, ingredients: list, steps: list, equipment: list, id: str = None):
         self.id = id if id else str(uuid.uuid4())
@@ -249,6 +254,7 @@ class RecipeService:
                 "Tongs or pasta server"
             ]
         )
+        _normalize_steps(test_recipe.steps)
         self._test_recipe_id = test_recipe.id  # Store the test recipe ID
         self._recipes[test_recipe.id] = test_recipe
         return test_recipe.id
@@ -394,6 +400,7 @@ class RecipeService:
             raise ValueError(f"Error processing recipe from URL: {str(e)}")
 
     def create_recipe(self, title: str, metadata: dict, ingredients: list, steps: list, equipment: list, id: str = None) -> Recipe:
+        _normalize_steps(steps)
         recipe = Recipe(title, metadata, ingredients, steps, equipment, id)
         self._recipes[recipe.id] = recipe
         return recipe
@@ -424,17 +431,13 @@ class RecipeService:
             if current_state == "cooking":
                 logger.info("Recipe is in cooking state, initializing step statuses")
                 if "step_statuses" not in recipe_copy.metadata:
-                    recipe_copy.metadata["step_statuses"] = {
-                        str(i+1): "not_started" for i in range(len(recipe_copy.steps))
-                    }
+                    recipe_copy.metadata["step_statuses"] = dict.fromkeys(map(str, range(1, len(recipe_copy.steps) + 1)), "not_started")
                     recipe_copy.metadata["step_statuses"]["1"] = "in_progress"
                 if "current_step" not in recipe_copy.metadata:
                     recipe_copy.metadata["current_step"] = 1
             elif current_state == "ready_to_cook":
                 logger.info("Recipe is in ready_to_cook state, keeping steps but marking as not started")
-                recipe_copy.metadata["step_statuses"] = {
-                    str(i+1): "not_started" for i in range(len(recipe_copy.steps))
-                }
+                recipe_copy.metadata["step_statuses"] = dict.fromkeys(map(str, range(1, len(recipe_copy.steps) + 1)), "not_started")
             else:
                 logger.info(f"Recipe is in {current_state} state, steps will be filtered in API response")
             
@@ -1,11 +1,30 @@
+import asyncio
 import requests
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 import logging
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Recipes reuse a small set of durations, so the formatted strings are memoized
+@lru_cache(maxsize=256)
+def format_duration(seconds: int, style: str = "long") -> str:
+    """Format seconds as "2 minutes and 5 seconds", or as "2m 5s" with the short style."""
+    minutes, secs = divmod(seconds, 60)
+    if style == "short":
+        return f"{minutes}m {secs}s" if minutes > 0 else f"{secs}s"
+    parts = []
+    if minutes:
+        parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+    if secs:
+        parts.append(f"{secs} second{'s' if secs != 1 else ''}")
+    return " and ".join(parts) if parts else "0 seconds"
+
 class ConversationState(str, Enum):
     INITIAL_SUMMARY = "initial_summary"
     ASKING_SERVINGS = "asking_servings"
@@ -14,6 +33,14 @@ class ConversationState(str, Enum):
     COOKING = "cooking"
 
 class TTSService:
+    # Cooking prompts answered by Mistral, kept so repeated turns skip the model call
+    _LLM_CACHE_SIZE = 512
+    # Synthesized prompts, so fixed phrases and repeated step guidance skip ElevenLabs
+    _AUDIO_CACHE_SIZE = 128
+    # Byte budget for the audio cache; clips over the per-clip cap (about two minutes of MP3) aren't cached
+    _AUDIO_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    _AUDIO_CACHE_MAX_CLIP_BYTES = 2 * 1024 * 1024
+
     def __init__(self):
         self.api_key = os.getenv("ELEVEN_LABS_API_KEY")
         if not self.api_key:
@@ -24,6 +51,24 @@ class TTSService:
             "Content-Type": "application/json",
             "xi-api-key": self.api_key
         }
+        # One service instance serves the whole app, so keep ElevenLabs connections alive between turns.
+        # Audio is synthesized from request threads and the prefetch worker, and a requests.Session
+        # isn't safe to share across threads, so each thread gets its own
+        self._sessions = threading.local()
+        self._llm_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._audio_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._audio_cache_bytes = 0
+        # Syntheses still running, so a second request for the same text waits instead of paying twice
+        self._audio_in_flight: Dict[str, Future] = {}
+        self._audio_cache_lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        """The calling thread's ElevenLabs session, created on first use."""
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = self._sessions.session = requests.Session()
+            session.headers.update(self.headers)
+        return session
 
     def _generate_audio(self, text: str) -> bytes:
         """Generate audio from text using ElevenLabs API."""
@@ -43,7 +88,7 @@ class TTSService:
                 }
             }
             
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self._session().post(url, json=payload)
             response.raise_for_status()
             
             return response.content
@@ -62,15 +107,56 @@ class TTSService:
             logger.error(f"Error generating recipe summary: {e}")
             raise
 
+    async def generate_recipe_summary_async(self, recipe_data: dict, state: ConversationState = ConversationState.INITIAL_SUMMARY) -> tuple[bytes, str]:
+        """Generate the recipe summary in a worker thread so the event loop stays free during synthesis."""
+        return await asyncio.to_thread(self.generate_recipe_summary, recipe_data, state)
+
     def generate_voice_response(self, message: str, state: ConversationState) -> tuple[bytes, str]:
         """Generate a voice response for the current conversation state."""
         try:
-            audio_data = self._generate_audio(message)
+            # Responses are also synthesized from worker threads, so the cache is locked
+            with self._audio_cache_lock:
+                audio_data = self._audio_cache.get(message)
+                if audio_data is not None:
+                    self._audio_cache.move_to_end(message)
+                    return audio_data, message
+                pending = self._audio_in_flight.get(message)
+                if pending is None:
+                    self._audio_in_flight[message] = in_flight = Future()
+            if pending is not None:
+                # Another thread (e.g. the step prefetch) is synthesizing this text already
+                return pending.result(), message
+
+            try:
+                audio_data = self._generate_audio(message)
+            except Exception as e:
+                with self._audio_cache_lock:
+                    del self._audio_in_flight[message]
+                in_flight.set_exception(e)
+                raise
+            with self._audio_cache_lock:
+                del self._audio_in_flight[message]
+                if len(audio_data) <= self._AUDIO_CACHE_MAX_CLIP_BYTES:
+                    self._audio_cache[message] = audio_data
+                    self._audio_cache_bytes += len(audio_data)
+                    while len(self._audio_cache) > self._AUDIO_CACHE_SIZE or self._audio_cache_bytes > self._AUDIO_CACHE_MAX_BYTES:
+                        _, evicted = self._audio_cache.popitem(last=False)
+                        self._audio_cache_bytes -= len(evicted)
+            in_flight.set_result(audio_data)
             return audio_data, message
         except Exception as e:
             logger.error(f"Error generating voice response: {e}")
             raise
 
+    def is_audio_cached(self, message: str) -> bool:
+        """Whether audio for this exact message is already cached or being synthesized."""
+        with self._audio_cache_lock:
+            return message in self._audio_cache or message in self._audio_in_flight
+
+    async def generate_voice_response_async(self, message: str, state: ConversationState) -> tuple[bytes, str]:
+        """Generate a voice response in a worker thread so the event loop stays free during synthesis."""
+        return await asyncio.to_thread(self.generate_voice_response, message, state)
+
     def generate_substitution_response(
         self, 
         recipe_id: str, 
@@ -104,14 +190,11 @@ class TTSService:
                 if (formatted := self._format_ingredient(ing))
             ]
             
-            if valid_ingredients:
-                for ingredient in valid_ingredients:
-                    response_text += f"- {ingredient}\n"
+            response_text += "".join(f"- {ingredient}\n" for ingredient in valid_ingredients)
             
             # Add equipment list
             response_text += "\nNow, here's the equipment you'll need:\n"
-            for item in updated_recipe.get("equipment", []):
-                response_text += f"- {item}\n"
+            response_text += "".join(f"- {item}\n" for item in updated_recipe.get("equipment", []))
             
             response_text += "\nDo you have all the equipment ready? Say 'ready' when you want to start cooking."
 
@@ -189,19 +272,7 @@ class TTSService:
         checkpoints = step.get("checkpoints")
 
         if timer and timer.get("duration"):
-            duration = timer["duration"]
-            minutes = duration // 60
-            seconds = duration % 60
-            
-            time_str = ""
-            if minutes > 0:
-                time_str += f"{minutes} minute{'s' if minutes != 1 else ''}"
-            if seconds > 0:
-                if time_str:
-                    time_str += " and "
-                time_str += f"{seconds} second{'s' if seconds != 1 else ''}"
-            
-            instruction += f" This step takes {time_str}."
+            instruction += f" This step takes {format_duration(timer['duration'])}."
 
         if checkpoints and isinstance(checkpoints, list) and checkpoints:
             checkpoint_str = ", ".join(checkpoints[:-1])
@@ -258,11 +329,13 @@ class TTSService:
                 if (formatted := self._format_ingredient(ing))
             ]
             
-            if valid_ingredients:
-                for ingredient in valid_ingredients:
-                    # Ensure each ingredient line is ASCII-compatible
+            lines = []
+            for ingredient in valid_ingredients:
+                # Ensure each ingredient line is ASCII-compatible
+                if not ingredient.isascii():
                     ingredient = ingredient.encode('ascii', 'replace').decode('ascii')
-                    response_text += f"- {ingredient}\n"
+                lines.append(f"- {ingredient}\n")
+            response_text += "".join(lines)
             
             response_text += "\nDo you need to substitute any of these ingredients?"
             
@@ -292,17 +365,17 @@ class TTSService:
         elif state == ConversationState.ASKING_SUBSTITUTION:
             # List ingredients and ask about substitutions
             summary = "Here are all the ingredients you'll need:\n"
-            for ingredient in ingredients:
-                if formatted := self._format_ingredient(ingredient):
-                    summary += f"- {formatted}\n"
+            summary += "".join(
+                f"- {formatted}\n" for ingredient in ingredients
+                if (formatted := self._format_ingredient(ingredient))
+            )
             summary += "\nDo you need to substitute any of these ingredients?"
             
         elif state == ConversationState.READY_TO_COOK:
             # Confirm ingredients and list equipment
             summary = "Great! Now that we have all the ingredients ready, "
             summary += "here's the equipment you'll need:\n"
-            for item in equipment:
-                summary += f"- {item}\n"
+            summary += "".join(f"- {item}\n" for item in equipment)
             summary += "\nDo you have all the equipment ready? Say 'ready' when you want to start cooking."
             
         else:
@@ -335,7 +408,7 @@ Timer information:
             if context['available_tasks']:
                 parallel_tasks_info = "\nAvailable parallel tasks:\n" + "\n".join(
                     f"• Step {task['step_number']}: {task['instruction']} "
-                    f"(estimated time: {task['estimated_time'] // 60}m {task['estimated_time'] % 60}s)"
+                    f"(estimated time: {format_duration(task['estimated_time'], 'short')})"
                     for task in context['available_tasks']
                 )
 
@@ -349,20 +422,14 @@ Timer information:
             user_input_lower = context['user_input'].lower()
             if user_input_lower in ['yes', 'yeah', 'sure', 'okay', 'ok'] and context['current_step_data'] and context['current_step_data'].get('timer'):
                 duration = context['current_step_data']['timer']['duration']
-                minutes = duration // 60
-                seconds = duration % 60
-                time_str = []
-                if minutes:
-                    time_str.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-                if seconds:
-                    time_str.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-                
-                response = f"Starting a timer for {' and '.join(time_str)}."
+                response = f"Starting a timer for {format_duration(duration)}."
                 if context['available_tasks']:
                     response += " While we wait, you can:\n"
-                    for task in context['available_tasks']:
-                        response += f"• Step {task['step_number']}: {task['instruction']} "
-                        response += f"(estimated time: {task['estimated_time'] // 60}m {task['estimated_time'] % 60}s)\n"
+                    response += "".join(
+                        f"• Step {task['step_number']}: {task['instruction']} "
+                        f"(estimated time: {format_duration(task['estimated_time'], 'short')})\n"
+                        for task in context['available_tasks']
+                    )
                 return f"{response}\nSYSTEM_ACTION: START_TIMER:{context['current_step']}"
 
             # Construct a detailed prompt for Mistral that includes action instructions
@@ -386,7 +453,7 @@ Previous steps (for context):
 {self._format_previous_steps(context['all_steps'], context['current_step'])}
 
 USER'S INPUT:
-{context['user_input']}
+{' '.join(context['user_input'].split())}
 
 As a cooking assistant, guide the user through the recipe. For each response:
 1. If the user says "start" and no step is active:
@@ -420,11 +487,20 @@ Format your response as:
 [Conversational response to user]
 SYSTEM_ACTION: [ACTION_TYPE:step_number] (if needed)"""
 
-            # Use Mistral to get the response
-            from services.mistral_service import get_mistral_response
-            logger.info("Sending prompt to Mistral:\n%s", prompt)
-            response = get_mistral_response(prompt, context)
-            logger.info("Raw response from Mistral:\n%s", response)
+            # Use Mistral to get the response; the prompt captures the full turn state
+            # and Mistral is seeded, so an identical prompt can reuse the earlier answer
+            response = self._llm_cache.get(prompt)
+            if response is not None:
+                self._llm_cache.move_to_end(prompt)
+                logger.info("Reusing cached Mistral response")
+            else:
+                from services.mistral_service import get_mistral_response
+                logger.info("Sending prompt to Mistral:\n%s", prompt)
+                response = get_mistral_response(prompt, context)
+                logger.info("Raw response from Mistral:\n%s", response)
+                self._llm_cache[prompt] = response
+                if len(self._llm_cache) > self._LLM_CACHE_SIZE:
+                    self._llm_cache.popitem(last=False)
             
             # Validate response format
             if "SYSTEM_ACTION:" not in response and context['user_input'].lower() == "start":
@@ -458,16 +534,7 @@ SYSTEM_ACTION: [ACTION_TYPE:step_number] (if needed)"""
         if not timer or 'duration' not in timer:
             return "No timer for this step"
         
-        duration = timer['duration']
-        minutes = duration // 60
-        seconds = duration % 60
-        time_str = []
-        if minutes:
-            time_str.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-        if seconds:
-            time_str.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-        
-        return f"This step takes {' and '.join(time_str)}"
+        return f"This step takes {format_duration(timer['duration'])}"
 
     def _format_ingredients_list(self, ingredients: List[Dict]) -> str:
         """Format ingredients list for the prompt."""
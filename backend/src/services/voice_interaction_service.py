@@ -1,28 +1,207 @@
+import asyncio
 import logging
 import re
-from typing import Dict, Tuple, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
 from models.schemas import ConversationState
-from services.tts_service import TTSService
-from services.recipe_service import RecipeService
+from services.tts_service import TTSService, format_duration
+from services.recipe_service import Recipe, RecipeService
 from services.substitution_service import SubstitutionService
 from services.parallel_task_service import ParallelTaskService
 
 logger = logging.getLogger(__name__)
 
+# Speech-to-text emits ASCII digits, so skip the Unicode digit class
+_DIGITS_RE = re.compile(r'\d+', re.ASCII)
+
+# Trigger words are matched against whole transcript tokens so that e.g. "fine" does not fire on "define"
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_NO_MORE_SUBSTITUTIONS_WORDS = frozenset({"no", "nope", "nah", "good", "fine"})
+_CONFIRM_WORDS = frozenset({"yes", "yeah", "yep", "sure", "okay"})
+_READY_WORDS = _CONFIRM_WORDS | {"ready"}
+_NOT_READY_WORDS = frozenset({"no", "nope", "nah", "wait"})
+# Substitution option picked by digit ("2") or word ("two"), detected and captured in one pass
+_SELECTION_RE = re.compile(r"(?<!\d)([1-3])(?!\d)|\b(one|two|three)\b")
+_NUMBER_WORDS = {"one": 1, "two": 2, "three": 3}
+_COMPLETION_WORDS = frozenset({"done", "finished", "ready", "complete", "completed"})
+# Multi-word completion phrases are matched with one alternation scan instead of a substring pass each
+_WATER_BOILED_PHRASES = ("water is boiled", "water is boiling", "water boiled")
+_COMPLETION_PHRASES = _WATER_BOILED_PHRASES + ("timer finished", "timer done", "time is up")
+_WATER_BOILED_RE = re.compile("|".join(map(re.escape, _WATER_BOILED_PHRASES)))
+_COMPLETION_PHRASE_RE = re.compile("|".join(map(re.escape, _COMPLETION_PHRASES)))
+_WATER_BOILING_WORDS = ("boil", "water")
+# Whole-transcript replies that accept the offered timer
+_TIMER_CONFIRMATIONS = frozenset({"yes", "yeah", "sure", "okay", "ok", "yes set a timer"})
+# SYSTEM_ACTION tag from the LLM, with the step number for the actions that take one
+_ACTION_RE = re.compile(r"(MARK_COMPLETED|START_TIMER|STOP_TIMER|NEXT_STEP|START_COOKING|FINISH_COOKING)(?::\s*(\d+))?")
+
+# Fixed prompts; they are plain ASCII, so they skip the _ascii_safe pass
+_MSG_NEED_SERVINGS = "I need a specific number. Please tell me how many servings you'd like to make."
+_MSG_UNCLEAR_SUBSTITUTION = "If you need to substitute any ingredient, just say which ingredient you want to substitute."
+_MSG_NOT_READY = "No problem. Take your time to prepare. Let me know when you're ready by saying 'ready'."
+_MSG_READY_UNCLEAR = "I didn't understand. Are you ready to start cooking? Please say 'ready' when you want to begin."
+_MSG_COOKING_ERROR = "I apologize, but I encountered an error processing your request. Would you like me to repeat the current step?"
+
+class _SubstitutionIntent(Enum):
+    DECLINE = "decline"
+    INGREDIENT = "ingredient"
+    CONFIRM = "confirm"
+    SELECTION = "selection"
+    UNCLEAR = "unclear"
+
+def _classify_substitution_intent(tokens: frozenset, pending: Optional[Dict]) -> _SubstitutionIntent:
+    """Classify a substitution turn from its tokens and any substitution already in flight."""
+    if not pending:
+        # No substitution in flight: the user either declines or names an ingredient
+        if not tokens.isdisjoint(_NO_MORE_SUBSTITUTIONS_WORDS):
+            return _SubstitutionIntent.DECLINE
+        return _SubstitutionIntent.INGREDIENT
+    if pending.get("ingredient"):
+        # Confirmation re-reads the options for the pending ingredient
+        if not tokens.isdisjoint(_CONFIRM_WORDS):
+            return _SubstitutionIntent.CONFIRM
+        if pending.get("awaiting_selection"):
+            return _SubstitutionIntent.SELECTION
+    return _SubstitutionIntent.UNCLEAR
+
+# Replayed conversation logs repeat the same short transcripts, so tokenizing is memoized
+@lru_cache(maxsize=256)
+def _tokenize(transcript_lower: str) -> frozenset:
+    """Split a lowercased transcript into a set of word tokens."""
+    return frozenset(_WORD_RE.findall(transcript_lower))
+
+# Keyed on the ingredient names, so a substitution that renames one gets a fresh index
+@lru_cache(maxsize=32)
+def _ingredient_name_index(items: Tuple[str, ...]) -> Dict[str, int]:
+    """Map each lowercased ingredient name to the position of the first ingredient with that name."""
+    index = {}
+    for position, item in enumerate(items):
+        index.setdefault(item.lower(), position)
+    return index
+
+# The ingredient list only changes on substitution, so its pattern is compiled once per list
+@lru_cache(maxsize=32)
+def _ingredient_mention_re(names: Tuple[str, ...]) -> re.Pattern:
+    """
+    Build one alternation over lowercased ingredient names, longest first so "olive oil" beats "oil".
+    Group 1 is the ingredient name; plural and possessive endings ("tomatoes", "garlic's") still match.
+    """
+    alternation = "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    return re.compile(rf"(?<![a-z0-9])({alternation})(?:e?s|'s)?(?![a-z0-9])")
+
+def _task_bullets(tasks: List[Dict]) -> str:
+    """Format parallel tasks as bullet lines, each starting with a newline."""
+    return "".join(
+        f"\n• Step {task['step_number']}: {task['instruction']} (estimated time: {format_duration(task['estimated_time'], 'short')})"
+        for task in tasks
+    )
+
+def _lowercase(text: str) -> str:
+    """Lowercase text, skipping the copy when speech-to-text already returned it lowercase."""
+    return text if text.islower() else text.lower()
+
+def _timer_info(duration: int, timer_type: str, step: int, warning_time: int = 20, parallel_tasks: Optional[List[Dict]] = None, step_statuses: Optional[Dict] = None) -> Dict:
+    """Build the timer data sent to the frontend; optional fields are left out when not given."""
+    info = {"duration": duration, "type": timer_type, "step": step, "warning_time": warning_time}
+    if parallel_tasks is not None:
+        info["parallel_tasks"] = parallel_tasks
+    if step_statuses is not None:
+        info["step_statuses"] = step_statuses
+    return info
+
+def _ascii_safe(text: str) -> str:
+    """Replace non-ASCII characters with '?', skipping the round-trip for pure ASCII text."""
+    if text.isascii():
+        return text
+    return text.encode('ascii', 'replace').decode('ascii')
+
 class VoiceInteractionService:
-    def __init__(self, tts_service: TTSService, recipe_service: RecipeService, substitution_service: SubstitutionService, parallel_task_service: ParallelTaskService):
+    # Conversation state -> handler that processes a transcript in that state
+    _STATE_HANDLERS = {
+        ConversationState.INITIAL_SUMMARY: "process_servings_request",
+        ConversationState.ASKING_SERVINGS: "process_servings_request",
+        ConversationState.ASKING_SUBSTITUTION: "process_substitution_request",
+        ConversationState.READY_TO_COOK: "process_ready_to_cook",
+        ConversationState.COOKING: "process_cooking_step",
+    }
+
+    # Built step guidance per (recipe id, step number), kept in memory rather than in the recipe
+    _STEP_GUIDANCE_CACHE_SIZE = 256
+
+    # LLM SYSTEM_ACTION tag -> cooking action handler, in the priority order the tags are checked
+    _COOKING_ACTIONS = {
+        "MARK_COMPLETED": "_action_mark_completed",
+        "START_TIMER": "_action_start_timer",
+        "STOP_TIMER": "_action_stop_timer",
+        "NEXT_STEP": "_action_next_step",
+        "START_COOKING": "_action_start_cooking",
+        "FINISH_COOKING": "_action_finish_cooking",
+    }
+
+    # Substitution intent -> handler; unclear input has no handler and gets the default prompt
+    _SUBSTITUTION_HANDLERS = {
+        _SubstitutionIntent.DECLINE: "_handle_no_more_substitutions",
+        _SubstitutionIntent.INGREDIENT: "_handle_ingredient_mention",
+        _SubstitutionIntent.CONFIRM: "_handle_substitution_confirmation",
+        _SubstitutionIntent.SELECTION: "_handle_substitution_selection",
+    }
+
+    def __init__(self, tts_service: TTSService, recipe_service: RecipeService, substitution_service: SubstitutionService, parallel_task_service: ParallelTaskService, prefetch_tts: bool = False):
         self.tts_service = tts_service
         self.recipe_service = recipe_service
         self.substitution_service = substitution_service
         self.parallel_task_service = parallel_task_service
+        # Turns mutate shared parallel-task state and write the recipe back, so they are processed one at a time.
+        # Taken in the worker thread, so it doesn't depend on the event loop it was created under
+        self._turn_lock = threading.Lock()
+        self._step_guidance_cache: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+        # Optional background synthesis of the step the user will most likely ask for next.
+        # Off by default since it pays for ElevenLabs audio the user may never hear
+        self._tts_prefetch = ThreadPoolExecutor(max_workers=1) if prefetch_tts else None
 
-    def process_servings_request(self, transcript: str, recipe_dict: Dict) -> Tuple[bytes, str, ConversationState, Dict]:
+    def shutdown(self) -> None:
+        """Stop the TTS prefetch worker, dropping prefetches that haven't started."""
+        if self._tts_prefetch is not None:
+            self._tts_prefetch.shutdown(wait=False, cancel_futures=True)
+
+    async def process_voice_input(self, state: ConversationState, transcript: str, recipe_id: str) -> Tuple[bytes, str, ConversationState, Optional[Recipe], Optional[object]]:
+        """
+        Route a transcript to the handler for the current conversation state and save the updated recipe.
+        The turn runs in a worker thread so LLM and TTS calls don't block the event loop.
+        Returns (audio_data, response_text, next_state, updated_recipe, extra_data), where
+        extra_data is the substitution options or timer data depending on the handler.
+        """
+        handler_name = self._STATE_HANDLERS.get(state)
+        if handler_name is None:
+            raise ValueError(f"Unsupported conversation state: {state}")
+        
+        return await asyncio.to_thread(self._process_turn, handler_name, transcript, recipe_id)
+
+    def _process_turn(self, handler_name: str, transcript: str, recipe_id: str) -> Tuple[bytes, str, ConversationState, Optional[Recipe], Optional[object]]:
+        """Read the recipe, run the handler and write the recipe back under the turn lock."""
+        with self._turn_lock:
+            # Read inside the lock so a concurrent turn on the same recipe can't overwrite this one's changes
+            recipe = self.recipe_service.get_recipe(recipe_id)
+            if recipe is None:
+                raise ValueError(f"Recipe not found: {recipe_id}")
+            result = getattr(self, handler_name)(transcript, recipe.__dict__, transcript_lower=_lowercase(transcript))
+            audio_data, response_text, next_state, updated_recipe = result[:4]
+            if updated_recipe:
+                updated_recipe = self.recipe_service.create_recipe(**updated_recipe)
+        return audio_data, response_text, next_state, updated_recipe, result[4] if len(result) > 4 else None
+
+    def process_servings_request(self, transcript: str, recipe_dict: Dict, transcript_lower: Optional[str] = None) -> Tuple[bytes, str, ConversationState, Dict]:
         """Process a request to change the number of servings."""
-        numbers = re.findall(r'\d+', transcript)
-        logger.info(f"Processing servings request. Found numbers: {numbers}")
+        # Only the first number is used, and digits don't need the lowercased transcript
+        match = _DIGITS_RE.search(transcript)
+        logger.info("Processing servings request. Found number: %s", match and match.group())
         
-        if numbers:
-            new_servings = int(numbers[0])
+        if match:
+            new_servings = int(match.group())
             next_state = ConversationState.ASKING_SUBSTITUTION
             
             # Adjust servings and create new recipe
@@ -36,227 +215,186 @@ class VoiceInteractionService:
             
             # Generate response and ensure it's ASCII-compatible
             audio_data, response_text = self.tts_service.generate_servings_response(adjusted_recipe, new_servings)
-            response_text = response_text.encode('ascii', 'replace').decode('ascii')
+            response_text = _ascii_safe(response_text)
             
             return audio_data, response_text, next_state, adjusted_recipe
         else:
-            # Generate response and ensure it's ASCII-compatible
-            audio_data, response_text = self.tts_service.generate_voice_response(
-                "I need a specific number. Please tell me how many servings you'd like to make.",
-                ConversationState.ASKING_SERVINGS
-            )
-            response_text = response_text.encode('ascii', 'replace').decode('ascii')
+            audio_data, response_text = self.tts_service.generate_voice_response(_MSG_NEED_SERVINGS, ConversationState.ASKING_SERVINGS)
             
             return audio_data, response_text, ConversationState.ASKING_SERVINGS, recipe_dict
 
-    def process_substitution_request(self, transcript: str, recipe_dict: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[list]]:
+    def process_substitution_request(self, transcript: str, recipe_dict: Dict, transcript_lower: Optional[str] = None) -> Tuple[bytes, str, ConversationState, Dict, Optional[list]]:
         """Process a request for ingredient substitution."""
-        transcript_lower = transcript.lower()
-        pending = recipe_dict.get("metadata", {}).get("pending_substitution")
-        has_made_substitutions = recipe_dict.get("metadata", {}).get("has_made_substitutions", False)
+        if transcript_lower is None:
+            transcript_lower = _lowercase(transcript)
+        metadata = recipe_dict.setdefault("metadata", {})
+        pending = metadata.get("pending_substitution")
         
-        # Check for "no" to further substitutions
-        if any(word in transcript_lower for word in ["no", "nope", "nah", "good", "fine"]) and not pending:
-            recipe_dict["metadata"]["current_state"] = ConversationState.READY_TO_COOK
-            
-            # Only show final ingredients if substitutions were made
-            if has_made_substitutions:
-                response_text = "Great! Here's your final list of ingredients with the substitutions:\n"
-                for ingredient in recipe_dict["ingredients"]:
-                    if formatted := self.tts_service._format_ingredient(ingredient):
-                        response_text += f"- {formatted}\n"
-                response_text += "\nNow, here's the equipment you'll need:\n"
-            else:
-                response_text = "Great! Here's the equipment you'll need:\n"
-            
-            # Add equipment list
-            response_text += "\n".join(f"- {item}" for item in recipe_dict["equipment"])
-            response_text += "\nDo you have all the equipment ready? Say 'ready' when you want to start cooking."
-            
-            audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.READY_TO_COOK)
-            response_text = response_text.encode('ascii', 'replace').decode('ascii')
-            return audio_data, response_text, ConversationState.READY_TO_COOK, recipe_dict, None
-        
-        # Check for specific ingredient mention
-        if not pending:
-            for ingredient in recipe_dict["ingredients"]:
-                if ingredient["item"].lower() in transcript_lower:
-                    substitution_data = self.substitution_service.get_substitution_suggestions(
-                        ingredient["item"],
-                        recipe_dict
-                    )
-                    
-                    options_text = f"Here are some substitutions for {ingredient['item']}. "
-                    for i, option in enumerate(substitution_data["substitutions"], 1):
-                        options_text += f"Option {i}: {option['substitute']}. You'll need {option['amount']} {option['unit']}. {option['notes']}. "
-                    options_text += "Which option would you like to use? Just say the number: 1, 2, or 3."
-                    
-                    recipe_dict["metadata"]["pending_substitution"] = {
-                        "ingredient": ingredient["item"],
-                        "options": substitution_data["substitutions"],
-                        "awaiting_selection": True
-                    }
-                    
-                    # Remove id field if present
-                    recipe_dict.pop('id', None)
-                    
-                    audio_data, response_text = self.tts_service.generate_voice_response(options_text, ConversationState.ASKING_SUBSTITUTION)
-                    response_text = response_text.encode('ascii', 'replace').decode('ascii')
-                    return audio_data, response_text, ConversationState.ASKING_SUBSTITUTION, recipe_dict, substitution_data["substitutions"]
-        
-        # Handle pending substitution confirmation
-        if pending and pending.get("ingredient"):
-            if any(word in transcript_lower for word in ["yes", "yeah", "yep", "sure", "okay"]):
-                substitution_data = self.substitution_service.get_substitution_suggestions(
-                    pending["ingredient"],
-                    recipe_dict
-                )
-                
-                options_text = f"I found {len(substitution_data['substitutions'])} possible substitutions for {pending['ingredient']}. Let me read them to you. "
-                for i, option in enumerate(substitution_data["substitutions"], 1):
-                    options_text += f"Option {i}: {option['substitute']}. You'll need {option['amount']} {option['unit']}. {option['notes']}. "
-                options_text += "Which option would you like to use? Just say the number: 1, 2, or 3."
-                
-                recipe_dict["metadata"]["pending_substitution"] = {
-                    "ingredient": pending["ingredient"],
-                    "options": substitution_data["substitutions"],
-                    "awaiting_selection": True
-                }
-                
-                # Remove id field if present
-                recipe_dict.pop('id', None)
-                
-                audio_data, response_text = self.tts_service.generate_voice_response(options_text, ConversationState.ASKING_SUBSTITUTION)
-                response_text = response_text.encode('ascii', 'replace').decode('ascii')
-                return audio_data, response_text, ConversationState.ASKING_SUBSTITUTION, recipe_dict, substitution_data["substitutions"]
-            
-            elif pending.get("awaiting_selection") and any(num in transcript_lower for num in ["1", "2", "3", "one", "two", "three"]):
-                number_map = {"one": "1", "two": "2", "three": "3"}
-                for word, digit in number_map.items():
-                    transcript_lower = transcript_lower.replace(word, digit)
-                
-                selection = next(num for num in ["1", "2", "3"] if num in transcript_lower)
-                index = int(selection) - 1
-                
-                if "options" in pending and 0 <= index < len(pending["options"]):
-                    chosen_option = pending["options"][index]
-                    updated_recipe = self.substitution_service.apply_substitution(recipe_dict, chosen_option)
-                    
-                    # Mark that substitutions have been made
-                    updated_recipe["metadata"]["has_made_substitutions"] = True
-                    
-                    response_text = f"I've updated the recipe to use {chosen_option['substitute']}. Do you need to substitute any other ingredients?"
-                    audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.ASKING_SUBSTITUTION)
-                    response_text = response_text.encode('ascii', 'replace').decode('ascii')
-                    return audio_data, response_text, ConversationState.ASKING_SUBSTITUTION, updated_recipe, None
-        
-        # Default response for unclear input
-        audio_data, response_text = self.tts_service.generate_voice_response(
-            "If you need to substitute any ingredient, just say which ingredient you want to substitute.",
-            ConversationState.ASKING_SUBSTITUTION
+        intent = _classify_substitution_intent(_tokenize(transcript_lower), pending)
+        handler_name = self._SUBSTITUTION_HANDLERS.get(intent)
+        if handler_name:
+            # Handlers return None when the transcript didn't hold what the intent expected
+            result = getattr(self, handler_name)(transcript_lower, recipe_dict, metadata, pending)
+            if result:
+                return result
+        
+        return self._unclear_substitution_response(recipe_dict)
+
+    def _handle_no_more_substitutions(self, transcript_lower: str, recipe_dict: Dict, metadata: Dict, pending: Optional[Dict]) -> Tuple[bytes, str, ConversationState, Dict, Optional[list]]:
+        """Wrap up substitutions and list the final ingredients and equipment."""
+        metadata["current_state"] = ConversationState.READY_TO_COOK
+        
+        # Only show final ingredients if substitutions were made
+        if metadata.get("has_made_substitutions", False):
+            parts = ["Great! Here's your final list of ingredients with the substitutions:\n"]
+            parts.extend(
+                f"- {formatted}\n" for ingredient in recipe_dict["ingredients"]
+                if (formatted := self.tts_service._format_ingredient(ingredient))
+            )
+            parts.append("\nNow, here's the equipment you'll need:\n")
+        else:
+            parts = ["Great! Here's the equipment you'll need:\n"]
+        
+        # Add equipment list
+        parts.append("\n".join(f"- {item}" for item in recipe_dict["equipment"]))
+        parts.append("\nDo you have all the equipment ready? Say 'ready' when you want to start cooking.")
+        response_text = "".join(parts)
+        
+        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.READY_TO_COOK)
+        response_text = _ascii_safe(response_text)
+        return audio_data, response_text, ConversationState.READY_TO_COOK, recipe_dict, None
+
+    def _handle_ingredient_mention(self, transcript_lower: str, recipe_dict: Dict, metadata: Dict, pending: Optional[Dict]) -> Optional[Tuple[bytes, str, ConversationState, Dict, Optional[list]]]:
+        """Offer substitutions for the first recipe ingredient named, or return None if none was."""
+        ingredients = recipe_dict["ingredients"]
+        name_index = _ingredient_name_index(tuple(ingredient["item"] for ingredient in ingredients))
+        if not name_index:
+            return None
+        
+        match = _ingredient_mention_re(tuple(name_index)).search(transcript_lower)
+        if not match:
+            return None
+        
+        ingredient = ingredients[name_index[match.group(1)]]
+        substitution_data = self.substitution_service.get_substitution_suggestions(
+            ingredient["item"],
+            recipe_dict
+        )
+        return self._present_substitution_options(
+            recipe_dict,
+            ingredient["item"],
+            substitution_data["substitutions"],
+            f"Here are some substitutions for {ingredient['item']}. "
+        )
+
+    def _handle_substitution_confirmation(self, transcript_lower: str, recipe_dict: Dict, metadata: Dict, pending: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[list]]:
+        """Fetch and read out the options for the pending ingredient."""
+        substitution_data = self.substitution_service.get_substitution_suggestions(
+            pending["ingredient"],
+            recipe_dict
+        )
+        substitutions = substitution_data["substitutions"]
+        return self._present_substitution_options(
+            recipe_dict,
+            pending["ingredient"],
+            substitutions,
+            f"I found {len(substitutions)} possible substitutions for {pending['ingredient']}. Let me read them to you. "
         )
-        response_text = response_text.encode('ascii', 'replace').decode('ascii')
+
+    def _handle_substitution_selection(self, transcript_lower: str, recipe_dict: Dict, metadata: Dict, pending: Dict) -> Optional[Tuple[bytes, str, ConversationState, Dict, Optional[list]]]:
+        """Apply the option the user picked, or return None if no valid option was named."""
+        match = _SELECTION_RE.search(transcript_lower)
+        if not match:
+            return None
+        
+        digit, word = match.groups()
+        index = (int(digit) if digit else _NUMBER_WORDS[word]) - 1
+        
+        if "options" not in pending or not 0 <= index < len(pending["options"]):
+            return None
+        
+        chosen_option = pending["options"][index]
+        updated_recipe = self.substitution_service.apply_substitution(recipe_dict, chosen_option)
+        
+        # Mark that substitutions have been made
+        updated_recipe["metadata"]["has_made_substitutions"] = True
+        
+        response_text = f"I've updated the recipe to use {chosen_option['substitute']}. Do you need to substitute any other ingredients?"
+        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.ASKING_SUBSTITUTION)
+        response_text = _ascii_safe(response_text)
+        return audio_data, response_text, ConversationState.ASKING_SUBSTITUTION, updated_recipe, None
+
+    def _unclear_substitution_response(self, recipe_dict: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[list]]:
+        """Default response for unclear input while asking about substitutions."""
+        audio_data, response_text = self.tts_service.generate_voice_response(_MSG_UNCLEAR_SUBSTITUTION, ConversationState.ASKING_SUBSTITUTION)
         
         # Remove id field if present
         recipe_dict.pop('id', None)
         
         return audio_data, response_text, ConversationState.ASKING_SUBSTITUTION, recipe_dict, None
 
-    def process_ready_to_cook(self, transcript: str, recipe_dict: Dict) -> Tuple[bytes, str, ConversationState, Dict]:
+    def process_ready_to_cook(self, transcript: str, recipe_dict: Dict, transcript_lower: Optional[str] = None) -> Tuple[bytes, str, ConversationState, Dict]:
         """Process a request to start cooking."""
-        transcript_lower = transcript.lower()
-        if any(word in transcript_lower for word in ["yes", "yeah", "yep", "sure", "okay", "ready"]):
+        if transcript_lower is None:
+            transcript_lower = _lowercase(transcript)
+        tokens = _tokenize(transcript_lower)
+        metadata = recipe_dict.setdefault("metadata", {})
+        if not tokens.isdisjoint(_READY_WORDS):
             # Add steps to recipe data when transitioning to cooking state
-            recipe_dict["metadata"]["current_state"] = ConversationState.COOKING
-            recipe_dict["metadata"]["current_step"] = 1
-            recipe_dict["metadata"]["completed_steps"] = []
-            recipe_dict["metadata"]["active_parallel_steps"] = []
-            recipe_dict["metadata"]["active_step"] = 1
+            metadata["current_state"] = ConversationState.COOKING
+            metadata["current_step"] = 1
+            metadata["completed_steps"] = []
+            metadata["active_parallel_steps"] = []
+            metadata["active_step"] = 1
             
             # Initialize step statuses with first step as in_progress
             steps = recipe_dict.get("steps", [])
-            step_statuses = {str(i+1): "not_started" for i in range(len(steps))}
+            step_statuses = dict.fromkeys(map(str, range(1, len(steps) + 1)), "not_started")
             step_statuses["1"] = "in_progress"  # First step is now active
-            recipe_dict["metadata"]["step_statuses"] = step_statuses
+            metadata["step_statuses"] = step_statuses
             
             # Get first step guidance
-            first_step = steps[0]
-            response_text = self._build_step_guidance(first_step, 1)
+            response_text = self._step_guidance(recipe_dict, 1)
             
             audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-            response_text = response_text.encode('ascii', 'replace').decode('ascii')
+            response_text = _ascii_safe(response_text)
             return audio_data, response_text, ConversationState.COOKING, recipe_dict
-        elif any(word in transcript_lower for word in ["no", "nope", "nah", "wait", "not yet"]):
+        elif not tokens.isdisjoint(_NOT_READY_WORDS) or "not yet" in transcript_lower:
             # Remove steps from recipe data if present
             if "steps" in recipe_dict:
                 del recipe_dict["steps"]
-            recipe_dict["metadata"]["current_state"] = ConversationState.READY_TO_COOK
-            audio_data, response_text = self.tts_service.generate_voice_response(
-                "No problem. Take your time to prepare. Let me know when you're ready by saying 'ready'.",
-                ConversationState.READY_TO_COOK
-            )
-            response_text = response_text.encode('ascii', 'replace').decode('ascii')
+            metadata["current_state"] = ConversationState.READY_TO_COOK
+            audio_data, response_text = self.tts_service.generate_voice_response(_MSG_NOT_READY, ConversationState.READY_TO_COOK)
             return audio_data, response_text, ConversationState.READY_TO_COOK, recipe_dict
         else:
             # Remove steps from recipe data if present
             if "steps" in recipe_dict:
                 del recipe_dict["steps"]
-            recipe_dict["metadata"]["current_state"] = ConversationState.READY_TO_COOK
-            audio_data, response_text = self.tts_service.generate_voice_response(
-                "I didn't understand. Are you ready to start cooking? Please say 'ready' when you want to begin.",
-                ConversationState.READY_TO_COOK
-            )
-            response_text = response_text.encode('ascii', 'replace').decode('ascii')
+            metadata["current_state"] = ConversationState.READY_TO_COOK
+            audio_data, response_text = self.tts_service.generate_voice_response(_MSG_READY_UNCLEAR, ConversationState.READY_TO_COOK)
             return audio_data, response_text, ConversationState.READY_TO_COOK, recipe_dict
 
-    def process_cooking_step(self, transcript: str, recipe_dict: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[Dict]]:
+    def process_cooking_step(self, transcript: str, recipe_dict: Dict, transcript_lower: Optional[str] = None) -> Tuple[bytes, str, ConversationState, Dict, Optional[Dict]]:
         """Process cooking steps and handle timers with parallel tasks using Mistral LLM."""
+        if transcript_lower is None:
+            transcript_lower = _lowercase(transcript)
         try:
             # Get current state
-            current_step = recipe_dict.get("metadata", {}).get("current_step", 0)
-            timer_running = recipe_dict.get("metadata", {}).get("timer_running", False)
+            metadata = recipe_dict.setdefault("metadata", {})
+            current_step = metadata.get("current_step", 0)
+            timer_running = metadata.get("timer_running", False)
             steps = recipe_dict.get("steps", [])
             current_step_data = steps[current_step - 1] if current_step > 0 and current_step <= len(steps) else None
+            current_timer = current_step_data.get("timer") if current_step_data else None
 
             # Initialize parallel tasks if not already done
-            if not hasattr(self.parallel_task_service, 'parallel_tasks') or not self.parallel_task_service.parallel_tasks:
+            if not self.parallel_task_service.parallel_tasks:
                 logger.info("Initializing parallel tasks for recipe")
                 self.parallel_task_service.analyze_recipe_for_parallel_tasks(steps)
 
-            # Build context for Mistral
-            context = {
-                "recipe_title": recipe_dict.get("title", ""),
-                "current_step": current_step,
-                "total_steps": len(steps),
-                "current_step_data": current_step_data,
-                "all_steps": steps,
-                "ingredients": recipe_dict.get("ingredients", []),
-                "equipment": recipe_dict.get("equipment", []),
-                "timer_running": timer_running,
-                "completed_steps": self.parallel_task_service.completed_steps,
-                "available_tasks": self.parallel_task_service.get_available_parallel_tasks(
-                    current_step,
-                    current_step_data["timer"]["duration"] if current_step_data and current_step_data.get("timer") else float('inf')
-                ) if current_step > 0 else [],
-                "user_input": transcript
-            }
-
-            # Get Mistral's analysis and recommended action
-            response = self.tts_service.get_llm_cooking_guidance(context)
-            
-            # Initialize response_text with Mistral's base response
-            response_text = response.split("SYSTEM_ACTION:")[0].strip()
-            
-            # Check for step completion phrases
-            completion_phrases = [
-                "done", "finished", "ready", "complete", "completed",
-                "water is boiled", "water is boiling", "water boiled",
-                "timer finished", "timer done", "time is up"
-            ]
-            
             # Get the active timer step data if there is one
             active_timer_step = None
-            active_step = recipe_dict.get("metadata", {}).get("active_step")
+            active_step = metadata.get("active_step")
             if timer_running and active_step:
                 active_timer_step = steps[active_step - 1]
             
@@ -264,38 +402,38 @@ class VoiceInteractionService:
             is_water_boiling_step = False
             if active_timer_step:
                 step_instruction = active_timer_step.get('instruction', '').lower()
-                is_water_boiling_step = any(word in step_instruction for word in ['boil', 'water'])
+                is_water_boiling_step = any(word in step_instruction for word in _WATER_BOILING_WORDS)
             
             # Check for completion based on context
             should_complete_timer = False
             if timer_running and active_timer_step:
-                if any(phrase in transcript.lower() for phrase in completion_phrases):
+                if not _tokenize(transcript_lower).isdisjoint(_COMPLETION_WORDS) or _COMPLETION_PHRASE_RE.search(transcript_lower):
                     # General completion phrases always work
                     should_complete_timer = True
-                elif is_water_boiling_step and any(phrase in transcript.lower() for phrase in ["water is boiled", "water is boiling", "water boiled"]):
+                elif is_water_boiling_step and _WATER_BOILED_RE.search(transcript_lower):
                     # Water boiling phrases only work for water boiling steps
                     should_complete_timer = True
             
             if should_complete_timer:
-                # Automatically stop the timer and mark step as completed
-                recipe_dict["metadata"]["timer_running"] = False
-                recipe_dict["metadata"]["active_step"] = None  # Clear active step
-                
-                # End timer period and get next step information
+                # Automatically stop the timer and mark step as completed;
+                # end the timer period to get the next step information
                 timer_end_data = self.parallel_task_service.end_timer_period()
-                recipe_dict["metadata"]["completed_steps"] = self.parallel_task_service.completed_steps
-                recipe_dict["metadata"]["active_parallel_steps"] = []
+                metadata.update({
+                    "timer_running": False,
+                    "active_step": None,
+                    "completed_steps": self.parallel_task_service.completed_steps,
+                    "active_parallel_steps": [],
+                })
                 
                 # Update step statuses
-                step_statuses = recipe_dict.get("metadata", {}).get("step_statuses", {})
+                step_statuses = metadata.setdefault("step_statuses", {})
                 step_statuses[str(active_step)] = "completed"
-                recipe_dict["metadata"]["step_statuses"] = step_statuses
                 
                 # Get next main step from timer_end_data
                 next_main_step = timer_end_data.get('next_main_step')
                 if next_main_step:
                     # Update current step
-                    recipe_dict["metadata"]["current_step"] = next_main_step
+                    metadata["current_step"] = next_main_step
                     step_statuses[str(next_main_step)] = "in_progress"
                     
                     # Build response with next step guidance
@@ -307,391 +445,80 @@ class VoiceInteractionService:
                         response_text += "\nWould you like me to start a timer for this step?"
                 else:
                     response_text = f"Great! Step {active_step} is completed."
-                    if len(recipe_dict["metadata"]["completed_steps"]) == len(steps):
+                    if len(metadata["completed_steps"]) == len(steps):
                         response_text += "\nCongratulations! You've completed all the steps. Your dish should be ready now."
                 
                 audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                return audio_data, response_text, ConversationState.COOKING, recipe_dict, {
-                    "duration": 0,
-                    "type": "stop",
-                    "step": next_main_step or current_step,
-                    "warning_time": 0,
-                    "step_statuses": step_statuses
-                }
+                return audio_data, response_text, ConversationState.COOKING, recipe_dict, _timer_info(
+                    0, "stop", next_main_step or current_step, warning_time=0, step_statuses=step_statuses
+                )
+            
+            # Build context for Mistral (timer completions above are answered without it)
+            context = {
+                "recipe_title": recipe_dict.get("title", ""),
+                "current_step": current_step,
+                "total_steps": len(steps),
+                "current_step_data": current_step_data,
+                "all_steps": steps,
+                "ingredients": recipe_dict.get("ingredients", []),
+                "equipment": recipe_dict.get("equipment", []),
+                "timer_running": timer_running,
+                "completed_steps": self.parallel_task_service.completed_steps,
+                "available_tasks": self.parallel_task_service.get_available_parallel_tasks(
+                    current_step,
+                    current_timer["duration"] if current_timer else float('inf')
+                ) if current_step > 0 else [],
+                "user_input": transcript
+            }
+
+            # Get Mistral's analysis and recommended action
+            response = self.tts_service.get_llm_cooking_guidance(context)
+            
+            # Initialize response_text with Mistral's base response
+            response_text, _, action_part = response.partition("SYSTEM_ACTION:")
+            response_text = response_text.strip()
             
             # Parse Mistral's response for actions
-            if "SYSTEM_ACTION:" in response:
-                action_part = response.split("SYSTEM_ACTION:")[1].strip()
-                
-                # Handle different actions
-                if "MARK_COMPLETED:" in action_part:
-                    step_number = int(action_part.split("MARK_COMPLETED:")[1].strip().split()[0])
-                    
-                    # Check if step can be completed
-                    can_complete, reason = self._can_complete_step(recipe_dict, step_number)
-                    if not can_complete:
-                        response_text = f"Cannot complete this step yet. {reason}"
-                        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                        return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
-                    
-                    # Check if this is a timer step being completed
-                    step_data = steps[step_number - 1]
-                    is_timer_step = step_data.get("timer") is not None
-                    timer_running = recipe_dict.get("metadata", {}).get("timer_running", False)
-                    active_step = recipe_dict.get("metadata", {}).get("active_step")
-                    
-                    # Update completed steps and active parallel steps
-                    available_tasks = self.parallel_task_service.mark_step_completed(step_number)
-                    recipe_dict["metadata"]["completed_steps"] = self.parallel_task_service.completed_steps
-                    
-                    # Update step statuses
-                    step_statuses = recipe_dict.get("metadata", {}).get("step_statuses", {})
-                    step_statuses[str(step_number)] = "completed"
-                    recipe_dict["metadata"]["step_statuses"] = step_statuses
-                    
-                    # Remove from active parallel steps if present
-                    active_parallel_steps = recipe_dict.get("metadata", {}).get("active_parallel_steps", [])
-                    if step_number in active_parallel_steps:
-                        active_parallel_steps.remove(step_number)
-                    recipe_dict["metadata"]["active_parallel_steps"] = active_parallel_steps
-                    
-                    # If this was a timer step, stop the timer only if there are no available parallel tasks
-                    if is_timer_step and timer_running and active_step == step_number:
-                        if not available_tasks:
-                            recipe_dict["metadata"]["timer_running"] = False
-                            recipe_dict["metadata"]["active_step"] = None
-                            timer_end_data = self.parallel_task_service.end_timer_period()
-                            recipe_dict["metadata"]["completed_steps"] = self.parallel_task_service.completed_steps
-                            response_text = f"Great! Step {step_number} is completed and the timer has been stopped."
-                        else:
-                            response_text = f"Great! Step {step_number} is completed. The timer will continue running for remaining tasks."
-                    else:
-                        response_text = f"Great! Step {step_number} is completed."
-                    
-                    # Find the next main step
-                    next_main_step = None
-                    remaining_steps = []
-                    for i, step in enumerate(steps, 1):
-                        if i not in recipe_dict["metadata"]["completed_steps"] and i != step_number:
-                            remaining_steps.append(i)
-                            # If timer is running, only consider parallel tasks as next main step
-                            if timer_running and active_step:
-                                available_tasks = self.parallel_task_service.get_available_parallel_tasks(
-                                    active_step,
-                                    steps[active_step - 1]["timer"]["duration"]
-                                )
-                                if any(task['step_number'] == i for task in available_tasks):
-                                    next_main_step = i
-                                    break
-                            else:
-                                next_main_step = i
-                                break
-                    
-                    # Check available parallel tasks first
-                    if available_tasks:
-                        response_text += "\nWhile waiting, you can work on these tasks:\n"
-                        for task in available_tasks:
-                            est_time = task["estimated_time"]
-                            est_minutes = est_time // 60
-                            est_seconds = est_time % 60
-                            est_time_str = f"{est_minutes}m {est_seconds}s" if est_minutes > 0 else f"{est_seconds}s"
-                            response_text += f"• Step {task['step_number']}: {task['instruction']} (estimated time: {est_time_str})\n"
-                            # Mark available tasks as ready
-                            step_statuses[str(task['step_number'])] = "not_started"
-                    
-                    # Guide to the next main step if available
-                    if remaining_steps:
-                        if next_main_step:
-                            next_step_data = steps[next_main_step - 1]
-                            response_text += f"\nLet's move on to step {next_main_step}: {next_step_data['instruction']}"
-                            if next_step_data.get("timer") and not timer_running:
-                                response_text += "\nWould you like me to start a timer for this step?"
-                            recipe_dict["metadata"]["current_step"] = next_main_step
-                            step_statuses[str(next_main_step)] = "in_progress"
-                        else:
-                            response_text += f"\nThere are still {len(remaining_steps)} steps remaining. Please complete the current timer step first."
-                    else:
-                        response_text += "\nCongratulations! You've completed all the steps. Your dish should be ready now."
-                    
-                    # Keep timer step as in_progress if timer is still running
-                    timer_running = recipe_dict.get("metadata", {}).get("timer_running", False)
-                    active_step = recipe_dict.get("metadata", {}).get("active_step")
-                    if timer_running and active_step:
-                        step_statuses[str(active_step)] = "in_progress"
-                        timer_step_data = steps[active_step - 1]["timer"]
-                        available_tasks = self.parallel_task_service.get_available_parallel_tasks(
-                            active_step,
-                            timer_step_data["duration"]
-                        )
-                        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                        return audio_data, response_text, ConversationState.COOKING, recipe_dict, {
-                            "duration": timer_step_data["duration"],
-                            "type": timer_step_data["type"],
-                            "step": active_step,
-                            "warning_time": 20,
-                            "parallel_tasks": available_tasks,
-                            "step_statuses": step_statuses
-                        }
-                    
-                    audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                    return audio_data, response_text, ConversationState.COOKING, recipe_dict, {
-                        "step_statuses": step_statuses,
-                        "current_step": next_main_step
-                    }
-                
-                elif "START_TIMER:" in action_part:
-                    step_number = int(action_part.split("START_TIMER:")[1].strip().split()[0])
-                    
-                    # Try to start the timer
-                    can_start, message, timer_data = self._handle_timer_start(recipe_dict, step_number)
-                    if not can_start:
-                        audio_data, response_text = self.tts_service.generate_voice_response(message, ConversationState.COOKING)
-                        return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
-                    
-                    # Update recipe state
-                    recipe_dict["metadata"]["timer_running"] = True
-                    recipe_dict["metadata"]["active_step"] = step_number
-                    
-                    # Update step statuses
-                    step_statuses = recipe_dict.get("metadata", {}).get("step_statuses", {})
-                    step_statuses[str(step_number)] = "in_progress"  # Mark timer step as in progress
-                    recipe_dict["metadata"]["step_statuses"] = step_statuses
-                    
-                    # Start timer and get available parallel tasks
-                    self.parallel_task_service.start_timer_period(step_number)
-                    
-                    # Format response with timer and parallel tasks
-                    minutes = timer_data["duration"] // 60
-                    seconds = timer_data["duration"] % 60
-                    time_str = []
-                    if minutes:
-                        time_str.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-                    if seconds:
-                        time_str.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-                    
-                    response_text = f"Starting a timer for {' and '.join(time_str)}. "
-                    
-                    # Sort available tasks by priority (prep tasks first, then by estimated time)
-                    if timer_data.get("parallel_tasks"):
-                        available_tasks = sorted(
-                            timer_data["parallel_tasks"],
-                            key=lambda x: (
-                                0 if any(word in x['instruction'].lower() for word in ['chop', 'dice', 'slice', 'mince', 'prepare', 'cut']) else 1,
-                                x['estimated_time']
-                            )
-                        )
-                        # Automatically guide to the first available task
-                        next_task = available_tasks[0]
-                        est_time = next_task['estimated_time']
-                        est_minutes = est_time // 60
-                        est_seconds = est_time % 60
-                        est_time_str = f"{est_minutes}m {est_seconds}s" if est_minutes > 0 else f"{est_seconds}s"
-                        
-                        response_text += f"While the timer is running, let's move on to step {next_task['step_number']}: {next_task['instruction']} (estimated time: {est_time_str})"
-                        
-                        # Update recipe state for the parallel task
-                        recipe_dict["metadata"]["current_step"] = next_task['step_number']
-                        active_parallel_steps = recipe_dict.get("metadata", {}).get("active_parallel_steps", [])
-                        if next_task['step_number'] not in active_parallel_steps:
-                            active_parallel_steps.append(next_task['step_number'])
-                        recipe_dict["metadata"]["active_parallel_steps"] = active_parallel_steps
-                        
-                        # Update step statuses for parallel tasks
-                        step_statuses[str(next_task['step_number'])] = "in_progress"  # Mark first parallel task as in progress
-                        for task in available_tasks[1:]:
-                            step_statuses[str(task['step_number'])] = "not_started"  # Mark other parallel tasks as not started
-                    
-                    # Add step statuses to timer data
-                    timer_data["step_statuses"] = step_statuses
-                    
-                    audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                    return audio_data, response_text, ConversationState.COOKING, recipe_dict, timer_data
-                
-                elif "STOP_TIMER" in action_part:
-                    recipe_dict["metadata"]["timer_running"] = False
-                    active_step = recipe_dict["metadata"].get("active_step")  # Get active step before clearing it
-                    recipe_dict["metadata"]["active_step"] = None  # Clear active step
-                    
-                    # End timer period and get next step information
-                    timer_end_data = self.parallel_task_service.end_timer_period()
-                    recipe_dict["metadata"]["completed_steps"] = self.parallel_task_service.completed_steps
-                    recipe_dict["metadata"]["active_parallel_steps"] = []
-                    
-                    # Update step statuses
-                    step_statuses = recipe_dict.get("metadata", {}).get("step_statuses", {})
-                    if active_step:  # Use the active_step we got earlier
-                        step_statuses[str(active_step)] = "completed"
-                    recipe_dict["metadata"]["step_statuses"] = step_statuses
-                    
-                    # Get next main step from timer_end_data
-                    next_main_step = timer_end_data.get('next_main_step')
-                    if next_main_step:
-                        # Update current step
-                        recipe_dict["metadata"]["current_step"] = next_main_step
-                        step_statuses[str(next_main_step)] = "in_progress"
-                        
-                        # Build response with next step guidance
-                        next_step_data = steps[next_main_step - 1]
-                        response_text = f"Timer completed! Step {active_step} is done. Let's move on to step {next_main_step}: {next_step_data['instruction']}"
-                        
-                        # Add timer prompt if next step has a timer
-                        if next_step_data.get("timer"):
-                            response_text += "\nWould you like me to start a timer for this step?"
-                    else:
-                        response_text = f"Timer completed! Step {active_step} is done."
-                        if len(recipe_dict["metadata"]["completed_steps"]) == len(steps):
-                            response_text += "\nCongratulations! You've completed all the steps. Your dish should be ready now."
-                    
-                    audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                    return audio_data, response_text, ConversationState.COOKING, recipe_dict, {
-                        "duration": 0,
-                        "type": "stop",
-                        "step": next_main_step or current_step,
-                        "warning_time": 0,
-                        "step_statuses": step_statuses
-                    }
-                
-                elif "NEXT_STEP" in action_part:
-                    if current_step < len(steps):
-                        next_step = current_step + 1
-                        # Validate the transition
-                        is_valid, reason = self._validate_step_transition(recipe_dict, current_step, next_step)
-                        if not is_valid:
-                            response_text = f"We can't move to the next step yet. {reason}"
-                            audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                            return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
-
-                        # Update step statuses
-                        step_statuses = recipe_dict.get("metadata", {}).get("step_statuses", {})
-                        step_statuses[str(next_step)] = "in_progress"
-                        recipe_dict["metadata"]["step_statuses"] = step_statuses
-                        
-                        # Keep timer step as in_progress if timer is running
-                        current_timer_running = recipe_dict.get("metadata", {}).get("timer_running", False)
-                        active_step = recipe_dict.get("metadata", {}).get("active_step")
-                        if current_timer_running and active_step:
-                            step_statuses[str(active_step)] = "in_progress"
-                        
-                        # Update current step
-                        current_step = next_step
-                        recipe_dict["metadata"]["current_step"] = current_step
-                        
-                        # If this is a parallel task, add to active parallel steps
-                        if current_timer_running and active_step:
-                            available_tasks = self.parallel_task_service.get_available_parallel_tasks(
-                                active_step,
-                                steps[active_step - 1]["timer"]["duration"]
-                            )
-                            if any(task['step_number'] == current_step for task in available_tasks):
-                                active_parallel_steps = recipe_dict.get("metadata", {}).get("active_parallel_steps", [])
-                                if current_step not in active_parallel_steps:
-                                    active_parallel_steps.append(current_step)
-                                recipe_dict["metadata"]["active_parallel_steps"] = active_parallel_steps
-                        
-                        next_step_data = steps[current_step - 1]
-                        response_text = self._build_step_guidance(next_step_data, current_step)
-                        
-                        # Always keep timer data if timer is running
-                        timer_info = None
-                        if current_timer_running and active_step:
-                            timer_step_data = steps[active_step - 1]["timer"]
-                            available_tasks = self.parallel_task_service.get_available_parallel_tasks(
-                                active_step,
-                                timer_step_data["duration"]
-                            )
-                            timer_info = {
-                                "duration": timer_step_data["duration"],
-                                "type": timer_step_data["type"],
-                                "step": active_step,
-                                "warning_time": 20,
-                                "parallel_tasks": available_tasks,
-                                "step_statuses": step_statuses
-                            }
-                        
-                        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                        return audio_data, response_text, ConversationState.COOKING, recipe_dict, timer_info
-                    else:
-                        # Remind user to finish current timer step
-                        response_text = f"Let's finish step {active_step} first. The timer is still running."
-                        if available_tasks:
-                            response_text += " While waiting, you can work on:\n"
-                            for task in available_tasks:
-                                est_time = task['estimated_time']
-                                est_str = f"{est_time // 60}m {est_time % 60}s" if est_time >= 60 else f"{est_time}s"
-                                response_text += f"\n• Step {task['step_number']}: {task['instruction']} (estimated time: {est_str})"
-                        
-                        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                        return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
-                
-                elif "START_COOKING" in action_part:
-                    current_step = 1
-                    recipe_dict["metadata"]["current_step"] = current_step
-                    recipe_dict["metadata"]["completed_steps"] = []
-                    recipe_dict["metadata"]["active_parallel_steps"] = []
-                    recipe_dict["metadata"]["active_step"] = current_step
-                    # Initialize step statuses with first step as in_progress
-                    step_statuses = {str(i+1): "not_started" for i in range(len(steps))}
-                    step_statuses["1"] = "in_progress"  # First step is now active
-                    recipe_dict["metadata"]["step_statuses"] = step_statuses
-                    first_step = steps[current_step - 1]
-                    response_text = self._build_step_guidance(first_step, current_step)
-                    audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                    return audio_data, response_text, ConversationState.COOKING, recipe_dict, {
-                        "step_statuses": step_statuses
-                    }
-                
-                elif "FINISH_COOKING" in action_part:
-                    response_text = "Congratulations! You've completed all the steps. Your dish should be ready now. Enjoy!"
-                    audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                    return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
+            actions = {}
+            for action in _ACTION_RE.finditer(action_part):
+                actions.setdefault(action.group(1), action.group(2))
+            # If Mistral names several actions, the first in _COOKING_ACTIONS wins (MARK_COMPLETED first)
+            for tag, handler_name in self._COOKING_ACTIONS.items():
+                if tag in actions:
+                    return getattr(self, handler_name)(recipe_dict, metadata, steps, current_step, actions[tag], context)
 
             # Special handling for timer start requests
-            if transcript.lower() in ['yes', 'yeah', 'sure', 'okay', 'ok', 'yes set a timer'] and current_step_data and current_step_data.get('timer'):
-                timer_data = current_step_data["timer"]
-                recipe_dict["metadata"]["timer_running"] = True
-                recipe_dict["metadata"]["active_step"] = current_step
+            if transcript_lower in _TIMER_CONFIRMATIONS and current_timer:
+                timer_data = current_timer
+                metadata["timer_running"] = True
+                metadata["active_step"] = current_step
                 self.parallel_task_service.start_timer_period(current_step)
                 duration = int(timer_data["duration"])
                 
                 # Format response with timer and parallel tasks
-                minutes = duration // 60
-                seconds = duration % 60
-                time_str = []
-                if minutes:
-                    time_str.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-                if seconds:
-                    time_str.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-                
-                response_text = f"Starting a timer for {' and '.join(time_str)}."
+                response_text = f"Starting a timer for {format_duration(duration)}."
                 
                 # Sort available tasks by priority (prep tasks first, then by estimated time)
-                available_tasks = sorted(
-                    context['available_tasks'],
-                    key=lambda x: (
-                        0 if any(word in x['instruction'].lower() for word in ['chop', 'dice', 'slice', 'mince', 'prepare', 'cut']) else 1,
-                        x['estimated_time']
-                    )
-                )
+                available_tasks = self.parallel_task_service.rank_tasks(context['available_tasks'])
                 
+                step_statuses = metadata.setdefault("step_statuses", {})
+
                 # If there are parallel tasks available, automatically guide to the first one
                 if available_tasks:
                     next_task = available_tasks[0]
                     est_time = next_task['estimated_time']
-                    est_str = f"{est_time // 60}m {est_time % 60}s" if est_time >= 60 else f"{est_time}s"
+                    est_str = format_duration(est_time, 'short')
                     
                     # Update recipe state for the parallel task
-                    recipe_dict["metadata"]["current_step"] = next_task['step_number']
-                    active_parallel_steps = recipe_dict.get("metadata", {}).get("active_parallel_steps", [])
+                    metadata["current_step"] = next_task['step_number']
+                    active_parallel_steps = metadata.setdefault("active_parallel_steps", [])
                     if next_task['step_number'] not in active_parallel_steps:
                         active_parallel_steps.append(next_task['step_number'])
-                    recipe_dict["metadata"]["active_parallel_steps"] = active_parallel_steps
                     
                     # Update step statuses
-                    step_statuses = recipe_dict.get("metadata", {}).get("step_statuses", {})
                     step_statuses[str(next_task['step_number'])] = "in_progress"  # Mark first parallel task as in progress
                     for task in available_tasks[1:]:
                         step_statuses[str(task['step_number'])] = "not_started"  # Mark other parallel tasks as not started
-                    recipe_dict["metadata"]["step_statuses"] = step_statuses
                     
                     # Build response text based on the current step's context
                     current_step_instruction = steps[current_step - 1].get('instruction', '').lower()
@@ -701,40 +528,353 @@ class VoiceInteractionService:
                         response_text += f"\n\nWhile waiting for step {current_step}, let's move on to step {next_task['step_number']}: {next_task['instruction']} (estimated time: {est_str})"
                     
                     if len(available_tasks) > 1:
-                        response_text += "\n\nOther tasks you can work on:"
-                        for task in available_tasks[1:]:
-                            est_time = task['estimated_time']
-                            est_str = f"{est_time // 60}m {est_time % 60}s" if est_time >= 60 else f"{est_time}s"
-                            response_text += f"\n• Step {task['step_number']}: {task['instruction']} (estimated time: {est_str})"
+                        response_text += "\n\nOther tasks you can work on:" + _task_bullets(available_tasks[1:])
                 
                 audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
-                return audio_data, response_text, ConversationState.COOKING, recipe_dict, {
-                    "duration": duration,
-                    "type": timer_data["type"],
-                    "step": current_step,
-                    "warning_time": 20,
-                    "parallel_tasks": available_tasks,
-                    "step_statuses": recipe_dict["metadata"].get("step_statuses", {})
-                }
+                return audio_data, response_text, ConversationState.COOKING, recipe_dict, _timer_info(
+                    duration, timer_data["type"], current_step, parallel_tasks=available_tasks, step_statuses=step_statuses
+                )
 
             # Generate audio response for cases without specific actions
             audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
             return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
 
         except Exception as e:
-            logger.error(f"Error processing cooking step: {e}")
-            error_response = "I apologize, but I encountered an error processing your request. Would you like me to repeat the current step?"
-            audio_data, error_response = self.tts_service.generate_voice_response(error_response, ConversationState.COOKING)
+            logger.error("Error processing cooking step: %s", e)
+            # Fixed text, so after the first failure the audio comes from the TTS cache
+            audio_data, error_response = self.tts_service.generate_voice_response(_MSG_COOKING_ERROR, ConversationState.COOKING)
             return audio_data, error_response, ConversationState.COOKING, recipe_dict, None
 
-    def _validate_step_transition(self, recipe_dict: Dict, from_step: int, to_step: int) -> Tuple[bool, str]:
+    def _present_substitution_options(self, recipe_dict: Dict, ingredient_name: str, substitutions: list, prefix_text: str) -> Tuple[bytes, str, ConversationState, Dict, Optional[list]]:
+        """Read out substitution options and mark the ingredient as awaiting a selection."""
+        parts = [prefix_text]
+        parts.extend(
+            f"Option {i}: {option['substitute']}. You'll need {option['amount']} {option['unit']}. {option['notes']}. "
+            for i, option in enumerate(substitutions, 1)
+        )
+        parts.append("Which option would you like to use? Just say the number: 1, 2, or 3.")
+        
+        recipe_dict["metadata"]["pending_substitution"] = {
+            "ingredient": ingredient_name,
+            "options": substitutions,
+            "awaiting_selection": True
+        }
+        
+        # Remove id field if present
+        recipe_dict.pop('id', None)
+        
+        audio_data, response_text = self.tts_service.generate_voice_response("".join(parts), ConversationState.ASKING_SUBSTITUTION)
+        response_text = _ascii_safe(response_text)
+        return audio_data, response_text, ConversationState.ASKING_SUBSTITUTION, recipe_dict, substitutions
+
+    def _action_mark_completed(self, recipe_dict: Dict, metadata: Dict, steps: List[Dict], current_step: int, arg: Optional[str], context: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[Dict]]:
+        """Mark a step completed and guide to the next main step or parallel tasks."""
+        step_number = int(arg)
+
+        # Check if step can be completed
+        can_complete, reason = self._can_complete_step(recipe_dict, step_number)
+        if not can_complete:
+            response_text = f"Cannot complete this step yet. {reason}"
+            audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+            return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
+
+        # Check if this is a timer step being completed
+        step_data = steps[step_number - 1]
+        is_timer_step = step_data.get("timer") is not None
+        timer_running = metadata.get("timer_running", False)
+        active_step = metadata.get("active_step")
+
+        # Update completed steps and active parallel steps
+        available_tasks = self.parallel_task_service.mark_step_completed(step_number)
+        metadata["completed_steps"] = self.parallel_task_service.completed_steps
+
+        # Update step statuses
+        step_statuses = metadata.setdefault("step_statuses", {})
+        step_statuses[str(step_number)] = "completed"
+
+        # Remove from active parallel steps if present
+        active_parallel_steps = metadata.setdefault("active_parallel_steps", [])
+        if step_number in active_parallel_steps:
+            active_parallel_steps.remove(step_number)
+
+        # If this was a timer step, stop the timer only if there are no available parallel tasks
+        if is_timer_step and timer_running and active_step == step_number:
+            if not available_tasks:
+                metadata["timer_running"] = False
+                metadata["active_step"] = None
+                timer_end_data = self.parallel_task_service.end_timer_period()
+                metadata["completed_steps"] = self.parallel_task_service.completed_steps
+                response_text = f"Great! Step {step_number} is completed and the timer has been stopped."
+            else:
+                response_text = f"Great! Step {step_number} is completed. The timer will continue running for remaining tasks."
+        else:
+            response_text = f"Great! Step {step_number} is completed."
+
+        # Find the next main step
+        next_main_step = None
+        remaining_steps = []
+        timer_task_steps = None
+        tasks_memo = {}
+        completed = set(metadata["completed_steps"])
+        for i, step in enumerate(steps, 1):
+            if i not in completed and i != step_number:
+                remaining_steps.append(i)
+                # If timer is running, only consider parallel tasks as next main step
+                if timer_running and active_step:
+                    # The available tasks don't change inside this loop, so look them up once
+                    if timer_task_steps is None:
+                        available_tasks = self._timer_parallel_tasks(steps, active_step, tasks_memo)
+                        timer_task_steps = {task['step_number'] for task in available_tasks}
+                    if i in timer_task_steps:
+                        next_main_step = i
+                        break
+                else:
+                    next_main_step = i
+                    break
+
+        # Check available parallel tasks first
+        if available_tasks:
+            response_text += "\nWhile waiting, you can work on these tasks:" + _task_bullets(available_tasks) + "\n"
+            # Mark available tasks as ready
+            for task in available_tasks:
+                step_statuses[str(task['step_number'])] = "not_started"
+
+        # Guide to the next main step if available
+        if remaining_steps:
+            if next_main_step:
+                next_step_data = steps[next_main_step - 1]
+                response_text += f"\nLet's move on to step {next_main_step}: {next_step_data['instruction']}"
+                if next_step_data.get("timer") and not timer_running:
+                    response_text += "\nWould you like me to start a timer for this step?"
+                metadata["current_step"] = next_main_step
+                step_statuses[str(next_main_step)] = "in_progress"
+            else:
+                response_text += f"\nThere are still {len(remaining_steps)} steps remaining. Please complete the current timer step first."
+        else:
+            response_text += "\nCongratulations! You've completed all the steps. Your dish should be ready now."
+
+        # Keep timer step as in_progress if timer is still running
+        timer_running = metadata.get("timer_running", False)
+        active_step = metadata.get("active_step")
+        if timer_running and active_step:
+            step_statuses[str(active_step)] = "in_progress"
+            timer_step_data = steps[active_step - 1]["timer"]
+            available_tasks = self._timer_parallel_tasks(steps, active_step, tasks_memo)
+            audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+            return audio_data, response_text, ConversationState.COOKING, recipe_dict, _timer_info(
+                timer_step_data["duration"], timer_step_data["type"], active_step, parallel_tasks=available_tasks, step_statuses=step_statuses
+            )
+
+        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+        return audio_data, response_text, ConversationState.COOKING, recipe_dict, {
+            "step_statuses": step_statuses,
+            "current_step": next_main_step
+        }
+
+    def _action_start_timer(self, recipe_dict: Dict, metadata: Dict, steps: List[Dict], current_step: int, arg: Optional[str], context: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[Dict]]:
+        """Start the timer for a step and move on to the first parallel task."""
+        step_number = int(arg)
+
+        # Try to start the timer
+        can_start, message, timer_data = self._handle_timer_start(recipe_dict, step_number)
+        if not can_start:
+            audio_data, response_text = self.tts_service.generate_voice_response(message, ConversationState.COOKING)
+            return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
+
+        # Update recipe state
+        metadata["timer_running"] = True
+        metadata["active_step"] = step_number
+
+        # Update step statuses
+        step_statuses = metadata.setdefault("step_statuses", {})
+        step_statuses[str(step_number)] = "in_progress"  # Mark timer step as in progress
+
+        # Start timer and get available parallel tasks
+        self.parallel_task_service.start_timer_period(step_number)
+
+        # Format response with timer and parallel tasks
+        response_text = f"Starting a timer for {format_duration(int(timer_data['duration']))}. "
+
+        # _handle_timer_start already ranks the tasks (prep tasks first, then by estimated time)
+        if timer_data.get("parallel_tasks"):
+            available_tasks = timer_data["parallel_tasks"]
+            # Automatically guide to the first available task
+            next_task = available_tasks[0]
+            est_time = next_task['estimated_time']
+            est_time_str = format_duration(est_time, 'short')
+
+            response_text += f"While the timer is running, let's move on to step {next_task['step_number']}: {next_task['instruction']} (estimated time: {est_time_str})"
+
+            # Update recipe state for the parallel task
+            metadata["current_step"] = next_task['step_number']
+            active_parallel_steps = metadata.setdefault("active_parallel_steps", [])
+            if next_task['step_number'] not in active_parallel_steps:
+                active_parallel_steps.append(next_task['step_number'])
+
+            # Update step statuses for parallel tasks
+            step_statuses[str(next_task['step_number'])] = "in_progress"  # Mark first parallel task as in progress
+            for task in available_tasks[1:]:
+                step_statuses[str(task['step_number'])] = "not_started"  # Mark other parallel tasks as not started
+
+        # Add step statuses to timer data
+        timer_data["step_statuses"] = step_statuses
+
+        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+        return audio_data, response_text, ConversationState.COOKING, recipe_dict, timer_data
+
+    def _action_stop_timer(self, recipe_dict: Dict, metadata: Dict, steps: List[Dict], current_step: int, arg: Optional[str], context: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[Dict]]:
+        """Stop the running timer, completing its step."""
+        active_step = metadata.get("active_step")  # Get active step before clearing it
+
+        # End timer period and get next step information
+        timer_end_data = self.parallel_task_service.end_timer_period()
+        metadata.update({
+            "timer_running": False,
+            "active_step": None,
+            "completed_steps": self.parallel_task_service.completed_steps,
+            "active_parallel_steps": [],
+        })
+
+        # Update step statuses
+        step_statuses = metadata.setdefault("step_statuses", {})
+        if active_step:  # Use the active_step we got earlier
+            step_statuses[str(active_step)] = "completed"
+
+        # Get next main step from timer_end_data
+        next_main_step = timer_end_data.get('next_main_step')
+        if next_main_step:
+            # Update current step
+            metadata["current_step"] = next_main_step
+            step_statuses[str(next_main_step)] = "in_progress"
+
+            # Build response with next step guidance
+            next_step_data = steps[next_main_step - 1]
+            response_text = f"Timer completed! Step {active_step} is done. Let's move on to step {next_main_step}: {next_step_data['instruction']}"
+
+            # Add timer prompt if next step has a timer
+            if next_step_data.get("timer"):
+                response_text += "\nWould you like me to start a timer for this step?"
+        else:
+            response_text = f"Timer completed! Step {active_step} is done."
+            if len(metadata["completed_steps"]) == len(steps):
+                response_text += "\nCongratulations! You've completed all the steps. Your dish should be ready now."
+
+        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+        return audio_data, response_text, ConversationState.COOKING, recipe_dict, _timer_info(
+            0, "stop", next_main_step or current_step, warning_time=0, step_statuses=step_statuses
+        )
+
+    def _action_next_step(self, recipe_dict: Dict, metadata: Dict, steps: List[Dict], current_step: int, arg: Optional[str], context: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[Dict]]:
+        """Advance to the next step if the transition is allowed."""
+        if current_step < len(steps):
+            next_step = current_step + 1
+            current_timer_running = metadata.get("timer_running", False)
+            active_step = metadata.get("active_step")
+            # The running timer's parallel tasks are looked up once, for the validation and the timer data
+            available_tasks = None
+            if current_timer_running and active_step:
+                available_tasks = self._timer_parallel_tasks(steps, active_step, {})
+
+            # Validate the transition
+            is_valid, reason = self._validate_step_transition(recipe_dict, current_step, next_step, available_tasks)
+            if not is_valid:
+                response_text = f"We can't move to the next step yet. {reason}"
+                audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+                return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
+
+            # Update step statuses
+            step_statuses = metadata.setdefault("step_statuses", {})
+            step_statuses[str(next_step)] = "in_progress"
+
+            # Keep timer step as in_progress if timer is running
+            if current_timer_running and active_step:
+                step_statuses[str(active_step)] = "in_progress"
+
+            # Update current step
+            current_step = next_step
+            metadata["current_step"] = current_step
+
+            # If this is a parallel task, add to active parallel steps
+            if current_timer_running and active_step:
+                timer_step_data = steps[active_step - 1]["timer"]
+                if any(task['step_number'] == current_step for task in available_tasks):
+                    active_parallel_steps = metadata.setdefault("active_parallel_steps", [])
+                    if current_step not in active_parallel_steps:
+                        active_parallel_steps.append(current_step)
+
+            response_text = self._step_guidance(recipe_dict, current_step)
+            if not current_timer_running:
+                self._prefetch_step_guidance(recipe_dict, current_step + 1)
+
+            # Always keep timer data if timer is running
+            timer_info = None
+            if current_timer_running and active_step:
+                timer_info = _timer_info(
+                    timer_step_data["duration"], timer_step_data["type"], active_step, parallel_tasks=available_tasks, step_statuses=step_statuses
+                )
+
+            audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+            return audio_data, response_text, ConversationState.COOKING, recipe_dict, timer_info
+        else:
+            active_step = metadata.get("active_step")
+            if not (metadata.get("timer_running") and active_step):
+                # Already on the last step with no timer to wait for
+                response_text = "This is the last step. Let me know when you're done."
+                audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+                return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
+
+            # Remind user to finish current timer step
+            available_tasks = self._timer_parallel_tasks(steps, active_step, {})
+            response_text = f"Let's finish step {active_step} first. The timer is still running."
+            if available_tasks:
+                response_text += " While waiting, you can work on:\n" + _task_bullets(available_tasks)
+
+            audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+            return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
+
+    def _action_start_cooking(self, recipe_dict: Dict, metadata: Dict, steps: List[Dict], current_step: int, arg: Optional[str], context: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[Dict]]:
+        """Restart cooking from the first step."""
+        current_step = 1
+        # Initialize step statuses with first step as in_progress
+        step_statuses = dict.fromkeys(map(str, range(1, len(steps) + 1)), "not_started")
+        step_statuses["1"] = "in_progress"  # First step is now active
+        metadata.update({
+            "current_step": current_step,
+            "completed_steps": [],
+            "active_parallel_steps": [],
+            "active_step": current_step,
+            "step_statuses": step_statuses,
+        })
+        response_text = self._step_guidance(recipe_dict, current_step)
+        self._prefetch_step_guidance(recipe_dict, current_step + 1)
+        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+        return audio_data, response_text, ConversationState.COOKING, recipe_dict, {
+            "step_statuses": step_statuses
+        }
+
+    def _action_finish_cooking(self, recipe_dict: Dict, metadata: Dict, steps: List[Dict], current_step: int, arg: Optional[str], context: Dict) -> Tuple[bytes, str, ConversationState, Dict, Optional[Dict]]:
+        """Wrap up once all steps are done."""
+        response_text = "Congratulations! You've completed all the steps. Your dish should be ready now. Enjoy!"
+        audio_data, response_text = self.tts_service.generate_voice_response(response_text, ConversationState.COOKING)
+        return audio_data, response_text, ConversationState.COOKING, recipe_dict, None
+
+    def _timer_parallel_tasks(self, steps: List[Dict], active_step: int, tasks_memo: Dict) -> List[Dict]:
+        """Parallel tasks available while the timer on active_step runs, looked up once per memo."""
+        if active_step not in tasks_memo:
+            tasks_memo[active_step] = self.parallel_task_service.get_available_parallel_tasks(
+                active_step,
+                steps[active_step - 1]["timer"]["duration"]
+            )
+        return tasks_memo[active_step]
+
+    def _validate_step_transition(self, recipe_dict: Dict, from_step: int, to_step: int, available_tasks: Optional[List[Dict]] = None) -> Tuple[bool, str]:
         """
         Validate if a transition from one step to another is allowed.
+        available_tasks are the running timer's parallel tasks, if the caller already looked them up.
         Returns (is_valid, reason)
         """
         steps = recipe_dict.get("steps", [])
         metadata = recipe_dict.get("metadata", {})
-        step_statuses = metadata.get("step_statuses", {})
         timer_running = metadata.get("timer_running", False)
         active_step = metadata.get("active_step")
         completed_steps = metadata.get("completed_steps", [])
@@ -743,62 +883,80 @@ class VoiceInteractionService:
         if from_step < 1 or from_step > len(steps) or to_step < 1 or to_step > len(steps):
             return False, "Invalid step number"
 
-        # If there's a timer running, check if the requested step is a parallel task
-        if timer_running and active_step:
-            available_tasks = self.parallel_task_service.get_available_parallel_tasks(
-                active_step,
-                steps[active_step - 1]["timer"]["duration"]
-            )
-            is_parallel = any(task['step_number'] == to_step for task in available_tasks)
-            
-            # Allow moving to parallel tasks or back to the timer step
-            if not is_parallel and to_step != active_step:
+        # If there's a timer running, only parallel tasks or the timer step itself are allowed;
+        # returning to the timer step needs no parallel-task lookup
+        if timer_running and active_step and to_step != active_step:
+            if available_tasks is None:
+                available_tasks = self._timer_parallel_tasks(steps, active_step, {})
+            if not any(task['step_number'] == to_step for task in available_tasks):
                 return False, f"Step {to_step} cannot be done while timer is running on step {active_step}. You can only work on parallel tasks or return to step {active_step}."
 
-        # Check dependencies
-        current_step_data = steps[to_step - 1]
-        if hasattr(current_step_data, 'dependencies'):
-            for dep in current_step_data.dependencies:
-                if dep not in completed_steps:
-                    return False, f"Step {dep} must be completed before moving to step {to_step}"
+        # Check dependencies (RecipeService gives every step a list). The step being moved on from and
+        # a step whose timer is running count as under way, matching ParallelTaskService's availability rules
+        for dep in steps[to_step - 1]["dependencies"]:
+            if dep not in completed_steps and dep != from_step and not (timer_running and dep == active_step):
+                return False, f"Step {dep} must be completed before moving to step {to_step}"
 
         return True, ""
 
+    def _step_guidance(self, recipe_dict: Dict, step_number: int) -> str:
+        """Return the guidance for a step, building it once per recipe since steps don't change while cooking."""
+        recipe_id = recipe_dict.get("id")
+        if recipe_id is None:
+            return self._build_step_guidance(recipe_dict["steps"][step_number - 1], step_number)
+        
+        key = (recipe_id, step_number)
+        guidance = self._step_guidance_cache.get(key)
+        if guidance is not None:
+            self._step_guidance_cache.move_to_end(key)
+            return guidance
+        
+        guidance = self._step_guidance_cache[key] = self._build_step_guidance(recipe_dict["steps"][step_number - 1], step_number)
+        if len(self._step_guidance_cache) > self._STEP_GUIDANCE_CACHE_SIZE:
+            self._step_guidance_cache.popitem(last=False)
+        return guidance
+
+    def _prefetch_step_guidance(self, recipe_dict: Dict, step_number: int) -> None:
+        """Queue a step's guidance for background synthesis so NEXT_STEP finds it in the TTS cache."""
+        if self._tts_prefetch is None or step_number > len(recipe_dict["steps"]):
+            return
+        self._tts_prefetch.submit(self._synthesize_step_guidance, recipe_dict["steps"][step_number - 1], step_number)
+
+    def _synthesize_step_guidance(self, step_data: Dict, step_number: int) -> None:
+        """Build and synthesize a step's guidance on the prefetch worker, unless its audio is already cached."""
+        guidance = self._build_step_guidance(step_data, step_number)
+        if not self.tts_service.is_audio_cached(guidance):
+            self.tts_service.generate_voice_response(guidance, ConversationState.COOKING)
+
     def _build_step_guidance(self, step_data: Dict, step_number: int) -> str:
         """Build natural, conversational guidance for a cooking step."""
         # Start with the main instruction
-        response = f"Step {step_number}: {step_data['instruction']}"
+        parts = [f"Step {step_number}: {step_data['instruction']}"]
         
         # Add visual cues and tips in a natural way
         if step_data.get("checkpoints"):
-            response += f" You'll know you're on track when {' and '.join(step_data['checkpoints']).lower()}."
+            parts.append(f" You'll know you're on track when {' and '.join(step_data['checkpoints']).lower()}.")
         
         # Add warnings if any, phrased naturally
         if step_data.get("warnings"):
-            response += f" Just be careful not to {' or '.join(warning.lower() for warning in step_data['warnings'])}."
+            parts.append(f" Just be careful not to {' or '.join(step_data['warnings']).lower()}.")
         
         # Add helpful tips in a conversational way
-        if step_data.get("notes"):
-            response += f" Here's a helpful tip: {step_data['notes'][0].lower()}"
-            if len(step_data['notes']) > 1:
-                response += f", and remember to {' and '.join(note.lower() for note in step_data['notes'][1:])}."
+        notes = step_data.get("notes")
+        if notes:
+            parts.append(f" Here's a helpful tip: {notes[0].lower()}")
+            if len(notes) > 1:
+                parts.append(f", and remember to {' and '.join(notes[1:]).lower()}.")
             else:
-                response += "."
+                parts.append(".")
         
         # Add timer information in a natural way
-        if step_data.get("timer"):
-            duration = int(step_data["timer"]["duration"])
-            minutes = duration // 60
-            seconds = duration % 60
-            time_str = []
-            if minutes > 0:
-                time_str.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-            if seconds > 0:
-                time_str.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-            time_str = " and ".join(time_str) if time_str else "0 seconds"
-            response += f" This will take about {time_str}. Would you like me to set a timer?"
-        
-        return response
+        timer = step_data.get("timer")
+        if timer:
+            duration = int(timer["duration"])
+            parts.append(f" This will take about {format_duration(duration)}. Would you like me to set a timer?")
+        
+        return "".join(parts)
 
     def _can_complete_step(self, recipe_dict: Dict, step_number: int) -> Tuple[bool, str]:
         """
@@ -868,48 +1026,25 @@ class VoiceInteractionService:
         )
         
         # Format response with timer and parallel tasks
-        minutes = duration // 60
-        seconds = duration % 60
-        time_str = []
-        if minutes:
-            time_str.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-        if seconds:
-            time_str.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-        
-        message = f"Starting a timer for {' and '.join(time_str)}."
+        parts = [f"Starting a timer for {format_duration(duration)}."]
         
         # Sort available tasks by priority (prep tasks first, then by estimated time)
         if available_tasks:
-            available_tasks = sorted(
-                available_tasks,
-                key=lambda x: (
-                    0 if any(word in x['instruction'].lower() for word in ['chop', 'dice', 'slice', 'mince', 'prepare', 'cut']) else 1,
-                    x['estimated_time']
-                )
-            )
+            available_tasks = self.parallel_task_service.rank_tasks(available_tasks)
             
-            message += "\n\nWhile we wait, here are tasks you can work on:"
+            parts.append("\n\nWhile we wait, here are tasks you can work on:")
             
             # Add recommended task
             recommended = available_tasks[0]
             est_time = recommended['estimated_time']
-            est_str = f"{est_time // 60}m {est_time % 60}s" if est_time >= 60 else f"{est_time}s"
-            message += f"\n\nRecommended: Step {recommended['step_number']}: {recommended['instruction']} (estimated time: {est_str})"
+            est_str = format_duration(est_time, 'short')
+            parts.append(f"\n\nRecommended: Step {recommended['step_number']}: {recommended['instruction']} (estimated time: {est_str})")
             
             # Add other tasks
             if len(available_tasks) > 1:
-                message += "\n\nOther tasks:"
-                for task in available_tasks[1:]:
-                    est_time = task['estimated_time']
-                    est_str = f"{est_time // 60}m {est_time % 60}s" if est_time >= 60 else f"{est_time}s"
-                    message += f"\n• Step {task['step_number']}: {task['instruction']} (estimated time: {est_str})"
+                parts.append("\n\nOther tasks:")
+                parts.append(_task_bullets(available_tasks[1:]))
             
-            message += "\n\nTo start any of these tasks, say 'start step X' or 'move to step X'."
-        
-        return True, message, {
-            "duration": duration,
-            "type": timer_data["type"],
-            "step": step_number,
-            "warning_time": 20,
-            "parallel_tasks": available_tasks
-        } 
\ No newline at end of file
+            parts.append("\n\nTo start any of these tasks, say 'start step X' or 'move to step X'.")
+        
+        return True, "".join(parts), _timer_info(duration, timer_data["type"], step_number, parallel_tasks=available_tasks) 
\ No newline at end of file
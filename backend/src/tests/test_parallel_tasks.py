@@ -1,10 +1,11 @@
 import pytest
 import logging
 from src.services.parallel_task_service import ParallelTaskService, TaskStatus
-from typing import List, Dict
+from typing import List, Dict, Set
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Configure logging; run with -o log_cli_level=DEBUG to see the analysis dumps
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 @pytest.fixture
 def parallel_task_service():
@@ -45,6 +46,10 @@ def sample_recipe_steps() -> List[Dict]:
         }
     ]
 
+def step_numbers(tasks: List[Dict]) -> Set[int]:
+    """Step numbers of the given available tasks, for membership assertions."""
+    return {task['step_number'] for task in tasks}
+
 def test_task_analysis(parallel_task_service, sample_recipe_steps):
     """Test loading of parallel tasks from recipe data."""
     parallel_task_service.analyze_recipe_for_parallel_tasks(sample_recipe_steps)
@@ -61,18 +66,18 @@ def test_task_analysis(parallel_task_service, sample_recipe_steps):
 def test_available_tasks_during_timer(parallel_task_service, sample_recipe_steps):
     """Test getting available tasks during a timer period."""
     parallel_task_service.analyze_recipe_for_parallel_tasks(sample_recipe_steps)
-    print("\nParallel tasks after analysis:", parallel_task_service.parallel_tasks)
+    logger.debug("Parallel tasks after analysis: %s", parallel_task_service.parallel_tasks)
     
     # Start first timer (boiling water)
     parallel_task_service.start_timer_period(1)
     available_tasks = parallel_task_service.get_available_parallel_tasks(1, 300)
-    print("\nAvailable tasks during water boiling:", available_tasks)
+    logger.debug("Available tasks during water boiling: %s", available_tasks)
     
     # Step 2 should be available during water boiling
-    assert any(task['step_number'] == 2 for task in available_tasks)
+    assert 2 in step_numbers(available_tasks)
     
     # Step 5 should not be available yet (depends on step 2)
-    assert not any(task['step_number'] == 5 for task in available_tasks)
+    assert 5 not in step_numbers(available_tasks)
 
 def test_task_completion(parallel_task_service, sample_recipe_steps):
     """Test marking tasks as completed and updating dependencies."""
@@ -86,7 +91,7 @@ def test_task_completion(parallel_task_service, sample_recipe_steps):
     available_tasks = parallel_task_service.get_available_parallel_tasks(3, 480)
     
     # Step 4 should be available (parallel with step 3)
-    assert any(task['step_number'] == 4 for task in available_tasks)
+    assert 4 in step_numbers(available_tasks)
     
     # Complete step 2
     parallel_task_service.mark_step_completed(2)
@@ -117,27 +122,44 @@ def test_timer_period_management(parallel_task_service, sample_recipe_steps):
 def test_task_prerequisites(parallel_task_service, sample_recipe_steps):
     """Test handling of task prerequisites."""
     parallel_task_service.analyze_recipe_for_parallel_tasks(sample_recipe_steps)
-    print("\nParallel tasks after analysis:", parallel_task_service.parallel_tasks)
+    logger.debug("Parallel tasks after analysis: %s", parallel_task_service.parallel_tasks)
     
     # Start timer for step 3 (pasta cooking)
     parallel_task_service.start_timer_period(3)
     available_tasks = parallel_task_service.get_available_parallel_tasks(3, 480)
-    print("\nAvailable tasks before completing prerequisites:", available_tasks)
+    logger.debug("Available tasks before completing prerequisites: %s", available_tasks)
     
     # Step 5 should not be available (needs step 2 completed)
-    assert not any(task['step_number'] == 5 for task in available_tasks)
+    assert 5 not in step_numbers(available_tasks)
     
     # Complete prerequisites
-    parallel_task_service.mark_step_completed(1)
-    parallel_task_service.mark_step_completed(2)
-    print("\nCompleted steps:", parallel_task_service.completed_steps)
+    parallel_task_service.mark_steps_completed([1, 2])
+    logger.debug("Completed steps: %s", parallel_task_service.completed_steps)
     
     # Check available tasks again
     available_tasks = parallel_task_service.get_available_parallel_tasks(3, 480)
-    print("\nAvailable tasks after completing prerequisites:", available_tasks)
+    logger.debug("Available tasks after completing prerequisites: %s", available_tasks)
     
     # Step 5 should now be available
-    assert any(task['step_number'] == 5 for task in available_tasks)
+    assert 5 in step_numbers(available_tasks)
+
+def test_bulk_step_completion(sample_recipe_steps):
+    """Test that completing steps in bulk matches completing them one at a time."""
+    one_at_a_time = ParallelTaskService()
+    one_at_a_time.analyze_recipe_for_parallel_tasks(sample_recipe_steps)
+    one_at_a_time.start_timer_period(3)
+    one_at_a_time.mark_step_completed(1)
+    expected_tasks = one_at_a_time.mark_step_completed(2)
+    
+    bulk = ParallelTaskService()
+    bulk.analyze_recipe_for_parallel_tasks(sample_recipe_steps)
+    bulk.start_timer_period(3)
+    available_tasks = bulk.mark_steps_completed([1, 2])
+    
+    assert available_tasks == expected_tasks
+    assert bulk.completed_steps == one_at_a_time.completed_steps == [1, 2]
+    assert bulk.parallel_tasks[2].status == TaskStatus.COMPLETED
+    assert bulk.mark_steps_completed([]) == []
 
 def test_estimated_task_time(parallel_task_service, sample_recipe_steps):
     """Test task time estimation logic."""
@@ -168,11 +190,11 @@ def test_water_boiling_parallel_tasks(parallel_task_service, sample_recipe_steps
     available_tasks = parallel_task_service.get_available_parallel_tasks(1, 300)  # 5 minutes = 300 seconds
     
     # Log the analysis results
-    print("\nAvailable tasks during water boiling:", available_tasks)
-    print("All parallel tasks:", parallel_task_service.parallel_tasks)
+    logger.debug("Available tasks during water boiling: %s", available_tasks)
+    logger.debug("All parallel tasks: %s", parallel_task_service.parallel_tasks)
     
     # Step 2 (chopping garlic and parsley) should be available during water boiling
-    assert any(task['step_number'] == 2 for task in available_tasks), "Step 2 (chopping) should be available during water boiling"
+    assert 2 in step_numbers(available_tasks), "Step 2 (chopping) should be available during water boiling"
     
     # Verify the task details
     chopping_task = next(task for task in available_tasks if task['step_number'] == 2)
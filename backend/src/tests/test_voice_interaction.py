@@ -0,0 +1,91 @@
+import pytest
+from services.parallel_task_service import ParallelTaskService
+from services.voice_interaction_service import VoiceInteractionService, _ingredient_mention_re
+
+INGREDIENT_NAMES = ("tomato", "olive oil", "oil", "garlic")
+
+@pytest.mark.parametrize("transcript, expected", [
+    ("can i substitute the tomato?", "tomato"),
+    ("i don't have any tomatoes", "tomato"),
+    ("the garlic's too strong", "garlic"),
+    ("i'm out of olive oil", "olive oil"),
+    ("how long should it boil?", None),
+])
+def test_ingredient_mention(transcript, expected):
+    """Test that ingredient mentions match whole names, including plural and possessive forms."""
+    match = _ingredient_mention_re(INGREDIENT_NAMES).search(transcript)
+    assert (match.group(1) if match else None) == expected
+
+class FakeTTSService:
+    """Returns the text with empty audio, so cooking actions run without ElevenLabs."""
+    def generate_voice_response(self, message, state):
+        return b"", message
+
+@pytest.fixture
+def voice_interaction():
+    return VoiceInteractionService(
+        tts_service=FakeTTSService(),
+        recipe_service=None,
+        substitution_service=None,
+        parallel_task_service=ParallelTaskService()
+    )
+
+@pytest.fixture
+def dependent_recipe():
+    """Recipe steps as the parser writes them, each listing the steps it depends on."""
+    return {
+        "steps": [
+            {"step": 1, "instruction": "Bring a large pot of water to a boil. Add salt.", "timer": {"duration": 300, "type": "prep"}, "dependencies": []},
+            {"step": 2, "instruction": "While waiting for water to boil, chop garlic and parsley.", "estimated_time": 120, "dependencies": []},
+            {"step": 3, "instruction": "Add pasta to boiling water and cook until al dente.", "timer": {"duration": 480, "type": "cooking"}, "dependencies": [1]},
+            {"step": 4, "instruction": "While pasta cooks, heat olive oil in a pan.", "estimated_time": 60, "dependencies": [3]},
+            {"step": 5, "instruction": "Add chopped garlic to the heated oil.", "estimated_time": 120, "dependencies": [2, 4]},
+        ],
+        "metadata": {"current_step": 1, "completed_steps": [], "step_statuses": {}}
+    }
+
+def test_next_step_checks_dependencies(voice_interaction, dependent_recipe):
+    """Test that NEXT_STEP leaves completion to MARK_COMPLETED and refuses a step whose dependency isn't done."""
+    steps, metadata = dependent_recipe["steps"], dependent_recipe["metadata"]
+    voice_interaction.parallel_task_service.analyze_recipe_for_parallel_tasks(steps)
+    
+    voice_interaction._action_next_step(dependent_recipe, metadata, steps, 1, None, {"available_tasks": []})
+    assert metadata["current_step"] == 2
+    assert metadata["completed_steps"] == []
+    
+    # Step 3 depends on step 1, which was never marked completed
+    _, response_text, _, _, timer_data = voice_interaction._action_next_step(
+        dependent_recipe, metadata, steps, 2, None, {"available_tasks": []}
+    )
+    assert response_text == "We can't move to the next step yet. Step 1 must be completed before moving to step 3"
+    assert metadata["current_step"] == 2
+    assert timer_data is None
+    
+    metadata["completed_steps"] = [1]
+    voice_interaction._action_next_step(dependent_recipe, metadata, steps, 2, None, {"available_tasks": []})
+    assert metadata["current_step"] == 3
+    
+    # Step 4 depends only on step 3, the step being moved on from
+    voice_interaction._action_next_step(dependent_recipe, metadata, steps, 3, None, {"available_tasks": []})
+    assert metadata["current_step"] == 4
+    assert metadata["completed_steps"] == [1]
+
+def test_next_step_to_parallel_task_during_timer(voice_interaction, dependent_recipe):
+    """Test that a parallel task depending on the running timer step can be started."""
+    steps, metadata = dependent_recipe["steps"], dependent_recipe["metadata"]
+    parallel_task_service = voice_interaction.parallel_task_service
+    parallel_task_service.analyze_recipe_for_parallel_tasks(steps)
+    parallel_task_service.mark_step_completed(1)
+    parallel_task_service.start_timer_period(3)
+    metadata.update({"current_step": 3, "completed_steps": [1], "timer_running": True, "active_step": 3})
+    
+    _, response_text, _, _, timer_data = voice_interaction._action_next_step(
+        dependent_recipe, metadata, steps, 3, None, {"available_tasks": []}
+    )
+    
+    assert not response_text.startswith("We can't move"), response_text
+    assert metadata["current_step"] == 4
+    assert 4 in metadata["active_parallel_steps"]
+    # The timer step stays under way rather than completed
+    assert 3 not in metadata["completed_steps"]
+    assert timer_data["step"] == 3